@@ -9,11 +9,27 @@ __version__ = "0.1.0"
 __author__ = "Performance Testing Team"
 __email__ = "team@example.com"
 
-from .core.config import Config, TestConfig
-from .core.models import ServerMetrics, TestResult
-from .core.parser import WRKParser
-from .core.tester import PerformanceTester
-from .visualization.charts import ChartGenerator
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .core.config import Config, TestConfig
+    from .core.models import ServerMetrics, TestResult
+    from .core.parser import WRKParser
+    from .core.tester import PerformanceTester
+    from .visualization.charts import ChartGenerator
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for ``wrk-runner --help``, doesn't pull in rich and pydantic.
+_LAZY_IMPORTS = {
+    "PerformanceTester": ".core.tester",
+    "Config": ".core.config",
+    "TestConfig": ".core.config",
+    "TestResult": ".core.models",
+    "ServerMetrics": ".core.models",
+    "WRKParser": ".core.parser",
+    "ChartGenerator": ".visualization.charts",
+}
 
 __all__ = [
     "PerformanceTester",
@@ -24,3 +40,16 @@ __all__ = [
     "WRKParser",
     "ChartGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -1,25 +1,63 @@
 """Main CLI entry point for wrk-reporter."""
 
-import json
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-try:
-    import yaml  # type: ignore[import-untyped]
-except ImportError:
-    yaml = None
+from ..core._json import _json_dump, _json_write
 
-from ..core.config import Config, TestConfig
-from ..core.parser import WRKParser
-from ..core.tester import PerformanceTester
-from ..visualization.charts import ChartGenerator
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
-console = Console()
+# (header, style, justify) column specs for the result tables
+_SUMMARY_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("Server", "cyan", "left"),
+    ("URL", "magenta", "left"),
+    ("Requests/sec", "green", "left"),
+    ("Transfer/sec", "blue", "left"),
+)
+_PARSE_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("Server", "cyan", "left"),
+    ("Duration", "magenta", "left"),
+    ("Requests/sec", "green", "right"),
+    ("Avg Latency", "yellow", "right"),
+    ("P99 Latency", "red", "right"),
+    ("Transfer/sec", "blue", "right"),
+)
+
+
+def _fmt_number(value: Any) -> str:
+    return f"{value:,.2f}" if isinstance(value, (int, float)) else "N/A"
+
+
+def _fmt_ms(value: Any) -> str:
+    return f"{value:.2f}ms" if isinstance(value, (int, float)) else "N/A"
+
+
+def _fmt_transfer(perf: Dict[str, Any]) -> str:
+    if "transfer_per_sec" not in perf:
+        return "N/A"
+    return f"{perf['transfer_per_sec']} {perf.get('transfer_unit', 'B')}"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    from rich.console import Console
+
+    return Console()
+
+
+def _new_result_table(title: str, columns: Tuple[Tuple[str, str, str], ...]) -> "Table":
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify)  # type: ignore[arg-type]
+    return table
 
 
 @click.group()
@@ -43,6 +81,15 @@ def cli() -> None:
 @click.option("-w", "--warmup", type=int, help="Warmup time in seconds")
 @click.option("-o", "--output", help="Output directory")
 @click.option("-s", "--lua-script", help="Lua script for wrk")
+@click.option(
+    "-p",
+    "--parallel",
+    type=click.IntRange(min=1),
+    help="Number of tests to run concurrently",
+)
+@click.option(
+    "--reuse-cache", is_flag=True, help="Reuse stored results for unchanged runs"
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--name", help="Test name for quick mode")
 def test(
@@ -54,15 +101,21 @@ def test(
     warmup: Optional[int],
     output: Optional[str],
     lua_script: Optional[str],
+    parallel: Optional[int],
+    reuse_cache: bool,
     verbose: bool,
     name: Optional[str],
 ) -> None:
     """Run performance tests from configuration file or quick test with URL."""
+    console = _get_console()
+
     if verbose:
         import logging
 
         logging.getLogger().setLevel(logging.DEBUG)
 
+    from ..core.config import Config, TestConfig, _load_cached, load_config_file
+
     try:
         # Quick test mode - use URL argument
         if url:
@@ -73,6 +126,7 @@ def test(
                 warmup=warmup or 5,
                 output_dir=output or "quick_test",
                 lua_script=lua_script,
+                reuse_cache=reuse_cache,
                 tests=[TestConfig(name=name or "quick_test", url=url)],
             )
         else:
@@ -82,14 +136,11 @@ def test(
                 console.print(f"[red]Configuration file not found: {config}[/red]")
                 sys.exit(1)
 
-            if config_path.suffix.lower() in [".yml", ".yaml"]:
-                import yaml
-
-                with open(config_path) as f:
-                    config_data = yaml.safe_load(f)
+            # Bypass the parse cache in verbose mode to aid debugging
+            if verbose:
+                config_data = load_config_file(config_path)
             else:
-                with open(config_path) as f:
-                    config_data = json.load(f)
+                config_data = _load_cached(config_path)
 
             # Create config object
             config_obj = Config(**config_data)
@@ -107,8 +158,14 @@ def test(
                 config_obj.output_dir = output
             if lua_script:
                 config_obj.lua_script = lua_script
+            if parallel:
+                config_obj.max_workers = parallel
+            if reuse_cache:
+                config_obj.reuse_cache = True
 
         # Run tests
+        from ..core.tester import PerformanceTester
+
         tester = PerformanceTester(config_obj)
         if not tester.check_dependencies():
             sys.exit(1)
@@ -120,14 +177,23 @@ def test(
 
             if url:
                 # Quick test mode output
+                from rich.text import Text
+
                 console.print("\n[green]✓ Quick test complete![/green]")
+                # Pre-styled Text skips markup parsing of user-supplied values
                 for result in results:
-                    console.print(f"[blue]URL:[/blue] {result.url}")
-                    console.print(
-                        f"[green]Requests/sec:[/green] {result.metrics.requests_per_sec}"
-                    )
                     console.print(
-                        f"[blue]Transfer/sec:[/blue] {result.metrics.transfer_per_sec}"
+                        Text.assemble(("URL:", "blue"), f" {result.url}\n"),
+                        Text.assemble(
+                            ("Requests/sec:", "green"),
+                            f" {result.metrics.requests_per_sec}\n",
+                        ),
+                        Text.assemble(
+                            ("Transfer/sec:", "blue"),
+                            f" {result.metrics.transfer_per_sec}",
+                        ),
+                        sep="",
+                        highlight=False,
                     )
             else:
                 # Configuration file mode output
@@ -135,11 +201,7 @@ def test(
                 console.print(f"[blue]📊 Report: {report_file}[/blue]")
 
                 # Display summary table
-                table = Table(title="Test Results Summary")
-                table.add_column("Server", style="cyan")
-                table.add_column("URL", style="magenta")
-                table.add_column("Requests/sec", style="green")
-                table.add_column("Transfer/sec", style="blue")
+                table = _new_result_table("Test Results Summary", _SUMMARY_COLUMNS)
 
                 for result in results:
                     table.add_row(
@@ -170,6 +232,8 @@ def test(
 @click.option("--output", "-o", default="performance_config.json", help="Output file")
 def init_config(format: str, output: str) -> None:
     """Create sample configuration file."""
+    console = _get_console()
+
     sample_config = {
         "duration": 30,
         "connections": 1000,
@@ -193,12 +257,13 @@ def init_config(format: str, output: str) -> None:
     if format == "yaml":
         import yaml
 
+        from ..core.config import SafeDumper
+
         output_path = output_path.with_suffix(".yaml")
         with open(output_path, "w") as f:
-            yaml.dump(sample_config, f, default_flow_style=False)
+            yaml.dump(sample_config, f, default_flow_style=False, Dumper=SafeDumper)
     else:
-        with open(output_path, "w") as f:
-            json.dump(sample_config, f, indent=2)
+        _json_dump(sample_config, output_path)
 
     console.print(f"[green]✓ Sample configuration created: {output_path}[/green]")
 
@@ -207,20 +272,17 @@ def init_config(format: str, output: str) -> None:
 @click.argument("config_file")
 def validate(config_file: str) -> None:
     """Validate configuration file."""
+    console = _get_console()
+
+    from ..core.config import Config, _load_cached
+
     try:
         config_path = Path(config_file)
         if not config_path.exists():
             console.print(f"[red]Configuration file not found: {config_file}[/red]")
             sys.exit(1)
 
-        if config_path.suffix.lower() in [".yml", ".yaml"]:
-            import yaml
-
-            with open(config_path) as f:
-                config_data = yaml.safe_load(f)
-        else:
-            with open(config_path) as f:
-                config_data = json.load(f)
+        config_data = _load_cached(config_path)
 
         # Validate with Pydantic
         config = Config(**config_data)
@@ -228,8 +290,13 @@ def validate(config_file: str) -> None:
         console.print("[green]✓ Configuration is valid[/green]")
         console.print(f"[blue]Tests configured: {len(config.tests)}[/blue]")
 
+        from rich.text import Text
+
         for test in config.tests:
-            console.print(f"[green]✓[/green] {test.name} → {test.url}")
+            console.print(
+                Text.assemble(("✓", "green"), f" {test.name} → {test.url}"),
+                highlight=False,
+            )
 
     except Exception as e:
         console.print(f"[red]Validation failed: {e}[/red]")
@@ -248,69 +315,95 @@ def validate(config_file: str) -> None:
 @click.option("--output", "-o", help="Output file for parsed data")
 def parse(file_path: Optional[str], format: str, output: Optional[str]) -> None:
     """Parse wrk output file(s) and display results."""
-    parser = WRKParser()
+    console = _get_console()
+
+    from ..core.parser import WRKParser
 
+    # The table only shows metrics; JSON and YAML carry the raw wrk output too
+    keep_raw = format != "table"
+    parser = WRKParser(use_cache=True, keep_raw=keep_raw)
+
+    results: Iterable[Dict[str, Any]]
     if file_path:
         # Parse single file
         try:
-            result = parser.parse_file(file_path)
+            result = parser.parse_file(file_path, keep_raw=keep_raw)
             results = [result]
         except Exception as e:
             console.print(f"[red]Error parsing file: {e}[/red]")
             sys.exit(1)
     else:
-        # Scan and parse all files in results directory
-        results = parser.scan_and_parse_all()
-        if not results:
+        # Scan results directory lazily so each parsed file can be dropped as
+        # soon as its table row has been extracted
+        results = parser.iter_parse_all()
+
+    if format == "table":
+        table = _build_parse_table(results)
+        if table.row_count:
+            console.print(table)
+        else:
             console.print(
                 "[yellow]No wrk output files found in results directory[/yellow]"
             )
-            return
+        return
+
+    # The summary aggregates precede the per-test data, so collect them all
+    results = list(results)
+    if not results:
+        console.print("[yellow]No wrk output files found in results directory[/yellow]")
+        return
 
+    output_data = parser.get_summary_stats(results)
     if format == "json":
-        output_data = parser.get_summary_stats(results)
         if output:
-            with open(output, "w") as f:
-                json.dump(output_data, f, indent=2)
+            _json_dump(output_data, Path(output))
             console.print(f"[green]✓ Parsed data saved to {output}[/green]")
         else:
-            console.print(json.dumps(output_data, indent=2))
+            # Write straight to stdout; Rich would re-scan the whole dump for markup
+            _json_write(output_data, sys.stdout)
 
-    elif format == "yaml":
+    else:  # yaml format
         import yaml
 
-        output_data = parser.get_summary_stats(results)
+        from ..core.config import SafeDumper
+
         if output:
             with open(output, "w") as f:
-                yaml.dump(output_data, f, default_flow_style=False)
+                yaml.dump(output_data, f, default_flow_style=False, Dumper=SafeDumper)
             console.print(f"[green]✓ Parsed data saved to {output}[/green]")
         else:
-            yaml.dump(output_data, sys.stdout, default_flow_style=False)
-
-    else:  # table format
-        table = Table(title="WRK Performance Results")
-        table.add_column("Server", style="cyan")
-        table.add_column("Duration", style="magenta")
-        table.add_column("Requests/sec", style="green", justify="right")
-        table.add_column("Avg Latency", style="yellow", justify="right")
-        table.add_column("P99 Latency", style="red", justify="right")
-        table.add_column("Transfer/sec", style="blue", justify="right")
-
-        for result in results:
-            meta = result["metadata"]
-            perf = result["performance"]
-            latency = result["latency"]
-
-            table.add_row(
-                meta.get("server", "Unknown"),
-                perf.get("duration_parsed", "N/A"),
-                f"{perf.get('requests_per_sec_summary', 'N/A'):,.2f}",
-                f"{latency.get('p50_ms', 'N/A'):.2f}ms",
-                f"{latency.get('p99_ms', 'N/A'):.2f}ms",
-                f"{perf.get('transfer_per_sec', 'N/A')} {perf.get('transfer_unit', 'B')}",
+            yaml.dump(
+                output_data, sys.stdout, default_flow_style=False, Dumper=SafeDumper
             )
 
-        console.print(table)
+
+def _build_parse_table(results: Iterable[Dict[str, Any]]) -> "Table":
+    columns: List[List[str]] = [[] for _ in _PARSE_COLUMNS]
+    for result in results:
+        perf = result["performance"]
+        latency = result["latency"]
+        row = (
+            result["metadata"].get("server", "Unknown"),
+            perf.get("duration_parsed", "N/A"),
+            _fmt_number(perf.get("requests_per_sec_summary")),
+            _fmt_ms(latency.get("p50_ms")),
+            _fmt_ms(latency.get("p99_ms")),
+            _fmt_transfer(perf),
+        )
+        for column, value in zip(columns, row):
+            column.append(value)
+    # Always keep the server column; drop metric columns with no data at all
+    keep = [
+        i
+        for i, column in enumerate(columns)
+        if i == 0 or any(value != "N/A" for value in column)
+    ]
+    table = _new_result_table(
+        "WRK Performance Results", tuple(_PARSE_COLUMNS[i] for i in keep)
+    )
+    for row in zip(*(columns[i] for i in keep)):
+        table.add_row(*row)
+    return table
 
 
 @cli.command()
@@ -328,7 +421,11 @@ def parse(file_path: Optional[str], format: str, output: Optional[str]) -> None:
 @click.option("--open", is_flag=True, help="Open HTML report in browser")
 def visualize(format: str, output: Optional[str], results_dir: str, open: bool) -> None:
     """Generate visualizations from wrk output files."""
+    console = _get_console()
+
     try:
+        from ..visualization.charts import ChartGenerator
+
         generator = ChartGenerator(results_dir)
 
         if format == "html":
@@ -0,0 +1,58 @@
+"""On-disk pickle cache for data derived from files."""
+
+import hashlib
+import os
+import pickle  # nosec: B403 - only loads cache files written by this module
+import tempfile
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from .. import __version__
+
+T = TypeVar("T")
+
+CACHE_DIR = Path.home() / ".cache" / "wrk_runner"
+# Per namespace; the least recently used entries beyond this are removed
+_CACHE_MAX_ENTRIES = 512
+
+
+def _load_file_cached(path: Path, namespace: str, loader: Callable[[Path], T]) -> T:
+    """Return ``loader(path)``, reusing a pickled result while the file is unchanged.
+
+    Entries are keyed by the package version and the resolved path, mtime and
+    size, so upgrading or editing the file invalidates them without any
+    explicit bookkeeping. Whatever ``loader`` returns is stored as is, so it
+    must depend on nothing but the file itself.
+    """
+    stat = path.stat()
+    key = f"{__version__}:{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    cache_dir = CACHE_DIR / namespace
+    cache_file = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.pickle"
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached: T = pickle.load(f)  # nosec: B301 - cache is written by us
+            # Touch the entry so pruning drops the least recently used ones
+            os.utime(cache_file)
+            return cached
+        except Exception:  # nosec: B110 - fall back to loading the file
+            pass
+    data = loader(path)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written entry
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        entries = sorted(cache_dir.glob("*.pickle"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-_CACHE_MAX_ENTRIES]:
+            stale.unlink()
+    except OSError:
+        pass
+    return data
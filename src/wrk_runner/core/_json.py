@@ -0,0 +1,52 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_load(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _json_dumps(obj: Any, pretty: bool = True) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data: bytes = orjson.dumps(obj, option=option)
+        return data
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_dump(obj: Any, path: Path, pretty: bool = True) -> None:
+    Path(path).write_bytes(_json_dumps(obj, pretty=pretty))
+
+
+def _json_write(obj: Any, stream: IO[str], pretty: bool = True) -> None:
+    buffer = getattr(stream, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Hand orjson's bytes straight to the underlying binary stream; flush
+        # first so anything already written to the text layer stays in order
+        stream.flush()
+        buffer.write(_json_dumps(obj, pretty=pretty))
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+    if pretty:
+        json.dump(obj, stream, indent=2)
+    else:
+        json.dump(obj, stream, separators=(",", ":"))
+    stream.write("\n")
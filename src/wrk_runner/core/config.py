@@ -1,7 +1,20 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+import yaml
+from pydantic import BaseModel, Field, field_validator
+
+from ._cache import _load_file_cached
+from ._json import _json_load
+
+# SafeDumper is imported here for the CLI so both pick the same implementation
+try:
+    from yaml import CSafeDumper as SafeDumper  # noqa: F401
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML was built without libyaml; install the libyaml system package
+    # (e.g. libyaml-dev) and reinstall PyYAML to get the C implementation.
+    from yaml import SafeDumper, SafeLoader  # noqa: F401
 
 
 class TestConfig(BaseModel):
@@ -26,17 +39,49 @@ class Config(BaseModel):
     chart_format: str = Field(
         default="html", description="Chart format: html, json, rich"
     )
+    reuse_cache: bool = Field(
+        default=False, description="Reuse stored results for unchanged wrk runs"
+    )
+    max_workers: int = Field(
+        default=1, ge=1, description="Number of tests to run concurrently"
+    )
     tests: List[TestConfig] = Field(..., description="List of tests to run")
 
-    @validator("output_dir")
+    # Fields a TestConfig may override, in the order they are merged
+    override_fields: ClassVar[Tuple[str, ...]] = (
+        "duration",
+        "connections",
+        "threads",
+        "warmup",
+        "lua_script",
+    )
+    # Fields copied into each test's effective config; ``tests`` is left out
+    base_fields: ClassVar[Tuple[str, ...]] = override_fields + ("output_dir",)
+
+    @field_validator("output_dir")
+    @classmethod
     def validate_output_dir(cls, v: str) -> str:
-        Path(v).mkdir(parents=True, exist_ok=True)
-        return v
+        # The directory is created by PerformanceTester before writing output
+        return str(Path(v))
 
     def get_test_config(self, test: TestConfig) -> Dict[str, Any]:
-        config = self.dict()
-        for field in ["duration", "connections", "threads", "warmup", "lua_script"]:
+        config = {field: getattr(self, field) for field in self.base_fields}
+        for field in self.override_fields:
             test_value = getattr(test, field)
             if test_value is not None:
                 config[field] = test_value
         return config
+
+
+def load_config_file(path: Path) -> Dict[str, Any]:
+    data: Dict[str, Any]
+    if path.suffix.lower() in [".yml", ".yaml"]:
+        with open(path) as f:
+            data = yaml.load(f, Loader=SafeLoader)  # nosec: B506 - safe loader
+    else:
+        data = _json_load(path)
+    return data
+
+
+def _load_cached(path: Path) -> Dict[str, Any]:
+    return _load_file_cached(path, "config", load_config_file)
@@ -1,7 +1,13 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_now = datetime.now
+
+
+def _default_timestamp() -> str:
+    return _now().isoformat()
 
 
 class ServerMetrics(BaseModel):
@@ -15,14 +21,13 @@ class ServerMetrics(BaseModel):
     total_errors: Optional[int] = None
     raw_output: Optional[str] = None
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class TestResult(BaseModel):
     server: str = Field(..., description="Server/test identifier")
     url: str = Field(..., description="Tested URL")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=_default_timestamp)
     duration: int = Field(..., description="Test duration in seconds")
     connections: int = Field(..., description="Number of connections")
     threads: int = Field(..., description="Number of threads")
@@ -31,5 +36,9 @@ class TestResult(BaseModel):
     output_file: Optional[str] = None
     json_file: Optional[str] = None
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
+
+
+# Built once at import so batch dumps reuse the compiled serializer instead
+# of resolving it on every call
+TEST_RESULTS_ADAPTER = TypeAdapter(List[TestResult])
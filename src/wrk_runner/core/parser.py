@@ -1,8 +1,92 @@
+import mmap
+import os
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Union,
+)
+
+from ._cache import _load_file_cached
+
+# Result files are wrk_*.txt directly inside the results directory
+_RESULT_PREFIX = "wrk_"
+_RESULT_SUFFIX = ".txt"
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+# Below this many files process pool startup outweighs parsing in parallel
+_PARALLEL_MIN_FILES = 64
+
+_RE_FILENAME = re.compile(r"wrk_(.+?)_(\d{8}_\d{6})")
+_RE_THREADS_CONN = re.compile(r"(\d+)\s+threads\s+and\s+(\d+)\s+connections")
+_RE_DURATION = re.compile(r"for\s+(\d+\.?\d*)([smhd])")
+_RE_ALT_DURATION = re.compile(r"(\d+\.?\d*)s")
+_RE_URL = re.compile(r"test\s+@\s+(.+)")
+_RE_LATENCY_LINE = re.compile(
+    r"Latency\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)%"
+)
+_RE_REQ_LINE = re.compile(
+    r"Req/Sec\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)%"
+)
+_RE_TOTAL_LINE = re.compile(
+    r"(\d+\.?\d*\w*)\s+requests\s+in\s+(\d+\.?\d*\w*),\s+([\d.]+[KMG]?B)\s+read"
+)
+_RE_SUMMARY_REQ = re.compile(r"Requests/sec:\s+(\d+\.?\d*)")
+_RE_SUMMARY_TRANSFER = re.compile(r"Transfer/sec:\s+([\d.]+)\s*([KMG]?B)")
+_RE_TRANSFER = re.compile(r"Transfer/sec:\s+(\d+\.?\d*)\s*([KMGT]?B)")
+_RE_SOCKET_ERRORS = re.compile(
+    r"Socket errors: connect (\d+), read (\d+), write (\d+), timeout (\d+)"
+)
+_RE_STATUS_CODE = re.compile(r"(\d{3}):\s+(\d+)\s+\((\d+\.?\d*)%\)")
+# Anchored at line start: an unanchored leading \s+ retries every position of a
+# long whitespace run, which turns blank padding in script output quadratic
+_RE_PERCENTILE = re.compile(
+    r"^[ \t]*(50|75|90|95|99|99\.9)%[ \t]+(\d+\.?\d*)", re.MULTILINE
+)
+_PERCENTILE_KEYS = {
+    "50": "p50_ms",
+    "75": "p75_ms",
+    "90": "p90_ms",
+    "95": "p95_ms",
+    "99": "p99_ms",
+    "99.9": "p99_9_ms",
+}
+_RE_BUCKET = re.compile(r"([<>]) (\d+)ms:\s+(\d+) \((\d+\.?\d*)%\)")
+_UNIT_MULTIPLIERS = {"G": 1000000000, "M": 1000000, "K": 1000}
+_BUCKET_KEYS = {
+    ("<", "1"): "under_1ms",
+    ("<", "2"): "under_2ms",
+    ("<", "5"): "under_5ms",
+    ("<", "10"): "under_10ms",
+    ("<", "20"): "under_20ms",
+    ("<", "50"): "under_50ms",
+    ("<", "100"): "under_100ms",
+    ("<", "200"): "under_200ms",
+    ("<", "500"): "under_500ms",
+    ("<", "1000"): "under_1000ms",
+    (">", "1000"): "over_1000ms",
+}
+
+
+def _anchored_search(
+    pattern: Pattern[str], content: str, anchor: str
+) -> Optional[Match[str]]:
+    # Jump to the pattern's literal prefix with str.find so the regex engine
+    # only runs from there instead of trying every earlier offset
+    index = content.find(anchor)
+    if index < 0:
+        return None
+    return pattern.search(content, index)
 
 
 @dataclass
@@ -44,19 +128,58 @@ class SocketStats:
     timeout_errors: Optional[int] = None
 
 
+def _scan_result_entries(results_dir: Path) -> List["os.DirEntry[str]"]:
+    # One scandir pass: names and file types come from the directory listing,
+    # so nothing is stat'ed just to decide whether an entry is a result
+    try:
+        with os.scandir(results_dir) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.startswith(_RESULT_PREFIX)
+                and entry.name.endswith(_RESULT_SUFFIX)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _read_content(file_path: Path) -> str:
+    # Decode straight from a read-only mapping so the raw bytes live in the
+    # page cache rather than as a second heap copy next to the decoded str
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
 class WRKParser:
-    def __init__(self, results_dir: str = "results"):
+    def __init__(
+        self,
+        results_dir: Union[str, Path] = "results",
+        use_cache: bool = False,
+        keep_raw: bool = True,
+    ):
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        # Reuse parses of unchanged logs across runs when scanning results_dir
+        self.use_cache = use_cache
+        # Scans leave out raw_output when False; see read_raw_output
+        self.keep_raw = keep_raw
 
-    def parse_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def parse_file(
+        self,
+        file_path: Union[str, Path],
+        default_timestamp: Optional[str] = None,
+        keep_raw: bool = True,
+    ) -> Dict[str, Any]:
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        with open(file_path) as f:
-            content = f.read()
-        return {
-            "metadata": self._parse_metadata(file_path),
+        content = self._read_content(file_path)
+        result = {
+            "metadata": self._parse_metadata(file_path, default_timestamp),
             "configuration": self._parse_configuration(content),
             "performance": self._parse_performance_metrics(content),
             "latency": self._parse_latency_metrics(content),
@@ -64,18 +187,28 @@ class WRKParser:
             "socket_stats": self._parse_socket_stats(content),
             "status_codes": self._parse_status_codes(content),
             "latency_distribution": self._parse_latency_distribution(content),
-            "raw_output": content,
         }
+        if keep_raw:
+            result["raw_output"] = content
+        return result
+
+    def read_raw_output(self, file_path: Union[str, Path]) -> str:
+        """Read the wrk output of a result parsed with ``keep_raw=False``."""
+        return self._read_content(Path(file_path))
+
+    def _read_content(self, file_path: Path) -> str:
+        return _read_content(file_path)
 
-    def _parse_metadata(self, file_path: Path) -> Dict[str, Any]:
+    def _parse_metadata(
+        self, file_path: Path, default_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         filename = file_path.stem
-        server_match = re.match(r"wrk_(.+?)_(\d{8}_\d{6})", filename)
+        server_match = _RE_FILENAME.match(filename)
         server = server_match.group(1) if server_match else "unknown"
-        timestamp = (
-            server_match.group(2)
-            if server_match
-            else datetime.now().strftime("%Y%m%d_%H%M%S")
-        )
+        if server_match:
+            timestamp = server_match.group(2)
+        else:
+            timestamp = default_timestamp or time.strftime(_TIMESTAMP_FORMAT)
         return {
             "server": server,
             "timestamp": timestamp,
@@ -85,32 +218,27 @@ class WRKParser:
 
     def _parse_configuration(self, content: str) -> Dict[str, Any]:
         config: Dict[str, Any] = {}
-        threads_conn = re.search(
-            r"(\d+)\s+threads\s+and\s+(\d+)\s+connections", content
-        )
+        threads_conn = _RE_THREADS_CONN.search(content)
         if threads_conn:
             config["threads"] = int(threads_conn.group(1))
             config["connections"] = int(threads_conn.group(2))
-        duration = re.search(r"for\s+(\d+\.?\d*)([smhd])", content)
+        duration = _RE_DURATION.search(content)
         if duration:
             value, unit = duration.groups()
             config["duration"] = float(value)
             config["duration_unit"] = unit
         else:
-            alt_duration = re.search(r"(\d+\.?\d*)s", content)
+            alt_duration = _RE_ALT_DURATION.search(content)
             if alt_duration:
                 config["duration"] = float(alt_duration.group(1))
-        url = re.search(r"test\s+@\s+(.+)", content)
+        url = _RE_URL.search(content)
         if url:
             config["url"] = url.group(1).strip()
         return config
 
     def _parse_performance_metrics(self, content: str) -> Dict[str, Any]:
         metrics: Dict[str, Any] = {}
-        latency_line = re.search(
-            r"Latency\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)%",
-            content,
-        )
+        latency_line = _anchored_search(_RE_LATENCY_LINE, content, "Latency")
         if latency_line:
             groups = latency_line.groups()
             metrics["latency"] = {
@@ -122,10 +250,7 @@ class WRKParser:
                 "max_unit": groups[5],
                 "stdev_percentage": float(groups[6]),
             }
-        req_line = re.search(
-            r"Req/Sec\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)(\w+)\s+(\d+\.?\d*)%",
-            content,
-        )
+        req_line = _anchored_search(_RE_REQ_LINE, content, "Req/Sec")
         if req_line:
             groups = req_line.groups()
             metrics["requests"] = {
@@ -137,42 +262,33 @@ class WRKParser:
                 "max_unit": groups[5],
                 "stdev_percentage": float(groups[6]),
             }
-        total_line = re.search(
-            r"(\d+\.?\d*\w*)\s+requests\s+in\s+(\d+\.?\d*\w*),\s+([\d.]+[KMG]?B)\s+read",
-            content,
-        )
+        total_line = _RE_TOTAL_LINE.search(content)
         if total_line:
             metrics["total_requests"] = int(self._parse_value(total_line.group(1)))
             metrics["duration_parsed"] = total_line.group(2)
             metrics["bytes_read"] = int(self._parse_value(total_line.group(3)))
-        summary_req = re.search(r"Requests/sec:\s+(\d+\.?\d*)", content)
+        summary_req = _anchored_search(_RE_SUMMARY_REQ, content, "Requests/sec:")
         if summary_req:
             metrics["requests_per_sec_summary"] = float(summary_req.group(1))
-        summary_transfer = re.search(r"Transfer/sec:\s+([\d.]+)\s*([KMG]?B)", content)
+        summary_transfer = _anchored_search(
+            _RE_SUMMARY_TRANSFER, content, "Transfer/sec:"
+        )
         if summary_transfer:
             metrics["transfer_per_sec"] = float(summary_transfer.group(1))
             metrics["transfer_unit"] = summary_transfer.group(2)
         return metrics
 
     def _parse_latency_metrics(self, content: str) -> Dict[str, Any]:
-        latency = {}
-        percentiles = {
-            "p50_ms": r"\s+50%\s+(\d+\.?\d*)",
-            "p75_ms": r"\s+75%\s+(\d+\.?\d*)",
-            "p90_ms": r"\s+90%\s+(\d+\.?\d*)",
-            "p95_ms": r"\s+95%\s+(\d+\.?\d*)",
-            "p99_ms": r"\s+99%\s+(\d+\.?\d*)",
-            "p99_9_ms": r"\s+99\.9%\s+(\d+\.?\d*)",
-        }
-        for key, pattern in percentiles.items():
-            match = re.search(pattern, content)
-            if match:
-                latency[key] = float(match.group(1))
+        latency: Dict[str, Any] = {}
+        for match in _RE_PERCENTILE.finditer(content):
+            key = _PERCENTILE_KEYS[match.group(1)]
+            if key not in latency:
+                latency[key] = float(match.group(2))
         return latency
 
     def _parse_transfer_metrics(self, content: str) -> Dict[str, Any]:
         transfer: Dict[str, Any] = {}
-        transfer_match = re.search(r"Transfer/sec:\s+(\d+\.?\d*)\s*([KMGT]?B)", content)
+        transfer_match = _anchored_search(_RE_TRANSFER, content, "Transfer/sec:")
         if transfer_match:
             transfer["rate"] = float(transfer_match.group(1))
             transfer["unit"] = transfer_match.group(2)
@@ -180,10 +296,7 @@ class WRKParser:
 
     def _parse_socket_stats(self, content: str) -> Dict[str, int]:
         socket_stats: Dict[str, int] = {}
-        socket_errors = re.search(
-            r"Socket errors: connect (\d+), read (\d+), write (\d+), timeout (\d+)",
-            content,
-        )
+        socket_errors = _anchored_search(_RE_SOCKET_ERRORS, content, "Socket errors:")
         if socket_errors:
             socket_stats.update(
                 {
@@ -196,90 +309,108 @@ class WRKParser:
         return socket_stats
 
     def _parse_status_codes(self, content: str) -> Dict[int, Dict[str, Any]]:
-        status_codes = {}
-        status_pattern = r"(\d{3}):\s+(\d+)\s+\((\d+\.?\d*)%\)"
-        for status, count, percentage in re.findall(status_pattern, content):
-            status_codes[int(status)] = {
-                "count": int(count),
-                "percentage": float(percentage),
+        return {
+            int(match.group(1)): {
+                "count": int(match.group(2)),
+                "percentage": float(match.group(3)),
             }
-        return status_codes
+            for match in _RE_STATUS_CODE.finditer(content)
+        }
 
     def _parse_latency_distribution(self, content: str) -> Dict[str, Any]:
-        distribution = {}
-        bucket_patterns = {
-            "under_1ms": r"\u003c 1ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_2ms": r"\u003c 2ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_5ms": r"\u003c 5ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_10ms": r"\u003c 10ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_20ms": r"\u003c 20ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_50ms": r"\u003c 50ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_100ms": r"\u003c 100ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_200ms": r"\u003c 200ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_500ms": r"\u003c 500ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "under_1000ms": r"\u003c 1000ms:\s+(\d+) \((\d+\.?\d*)%\)",
-            "over_1000ms": r"\u003e 1000ms:\s+(\d+) \((\d+\.?\d*)%\)",
-        }
-        for key, pattern in bucket_patterns.items():
-            match = re.search(pattern, content)
-            if match:
+        distribution: Dict[str, Any] = {}
+        for match in _RE_BUCKET.finditer(content):
+            key = _BUCKET_KEYS.get((match.group(1), match.group(2)))
+            if key is not None and key not in distribution:
                 distribution[key] = {
-                    "count": int(match.group(1)),
-                    "percentage": float(match.group(2)),
+                    "count": int(match.group(3)),
+                    "percentage": float(match.group(4)),
                 }
         return distribution
 
     def _parse_value(self, value_str: str) -> float:
         value_str = str(value_str).upper()
-        multipliers = {
-            "GB": 1000000000,
-            "MB": 1000000,
-            "KB": 1000,
-            "G": 1000000000,
-            "M": 1000000,
-            "K": 1000,
-        }
-        for suffix, multiplier in sorted(
-            multipliers.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if value_str.endswith(suffix):
-                return float(value_str[: -len(suffix)]) * multiplier
+        if value_str.endswith("B"):
+            value_str = value_str[:-1]
+        multiplier = _UNIT_MULTIPLIERS.get(value_str[-1:])
+        if multiplier is not None:
+            return float(value_str[:-1]) * multiplier
         return float(value_str)
 
+    def _parse_or_report(
+        self, file_path: Path, default_timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            parse = partial(
+                self.parse_file,
+                default_timestamp=default_timestamp,
+                keep_raw=self.keep_raw,
+            )
+            # A file without a timestamp in its name gets the scan's fallback
+            # one, which a cached entry would keep forever, so parse it fresh
+            if self.use_cache and _RE_FILENAME.match(file_path.stem):
+                namespace = "parsed-raw" if self.keep_raw else "parsed"
+                return _load_file_cached(file_path, namespace, parse)
+            return parse(file_path)
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            return None
+
+    def iter_parse_all(self) -> Iterator[Dict[str, Any]]:
+        # Files without a timestamp in their name share one scan-wide fallback
+        default_timestamp = time.strftime(_TIMESTAMP_FORMAT)
+        for entry in _scan_result_entries(self.results_dir):
+            result = self._parse_or_report(Path(entry.path), default_timestamp)
+            if result is not None:
+                yield result
+
     def scan_and_parse_all(self) -> List[Dict[str, Any]]:
-        results = []
-        pattern = "wrk_*.txt"
-        for file_path in self.results_dir.glob(pattern):
-            try:
-                result = self.parse_file(file_path)
-                results.append(result)
-            except Exception as e:
-                print(f"Error parsing {file_path}: {e}")
-        return results
+        paths = [Path(entry.path) for entry in _scan_result_entries(self.results_dir)]
+        default_timestamps = repeat(time.strftime(_TIMESTAMP_FORMAT))
+        if len(paths) < _PARALLEL_MIN_FILES:
+            parsed: Iterable[Optional[Dict[str, Any]]] = map(
+                self._parse_or_report, paths, default_timestamps
+            )
+            return [result for result in parsed if result is not None]
+        # Imported here as it pulls in multiprocessing, which only this path needs
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(
+                self._parse_or_report,
+                paths,
+                default_timestamps,
+                chunksize=max(1, len(paths) // (workers * 4)),
+            )
+            return [result for result in parsed if result is not None]
 
     def get_summary_stats(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not results:
             return {}
-        summary = {
+        test_names = []
+        total_requests = 0
+        rps_sum = 0.0
+        rps_count = 0
+        latency_sum = 0.0
+        latency_count = 0
+        for r in results:
+            test_names.append(r["metadata"]["server"])
+            performance = r["performance"]
+            total_requests += performance.get("total_requests", 0)
+            rps = performance.get("requests_per_sec_summary")
+            if rps:
+                rps_sum += rps
+                rps_count += 1
+            p50 = r["latency"].get("p50_ms")
+            if p50:
+                latency_sum += p50
+                latency_count += 1
+        return {
             "total_tests": len(results),
-            "test_names": [r["metadata"]["server"] for r in results],
-            "total_requests": sum(
-                r["performance"].get("total_requests", 0) for r in results
-            ),
-            "avg_requests_per_sec": 0,
-            "avg_latency": 0,
+            "test_names": test_names,
+            "total_requests": total_requests,
+            "avg_requests_per_sec": rps_sum / rps_count if rps_count else 0,
+            "avg_latency": latency_sum / latency_count if latency_count else 0,
             "tests": results,
         }
-        valid_results = [
-            r for r in results if r["performance"].get("requests_per_sec_summary")
-        ]
-        if valid_results:
-            summary["avg_requests_per_sec"] = sum(
-                r["performance"]["requests_per_sec_summary"] for r in valid_results
-            ) / len(valid_results)
-        valid_latency = [r for r in results if r["latency"].get("p50_ms")]
-        if valid_latency:
-            summary["avg_latency"] = sum(
-                r["latency"]["p50_ms"] for r in valid_latency
-            ) / len(valid_latency)
-        return summary
@@ -1,34 +1,74 @@
+import functools
+import hashlib
 import logging
+import os
 import re
+import shutil
 import subprocess  # nosec: B404 - subprocess usage is validated with shell=False and input sanitization
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from ._json import _json_dumps
 from .config import Config, TestConfig
 from .models import ServerMetrics, TestResult
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_RE_NUMBER = re.compile(r"[\d.]+")
+_RE_TRANSFER_VALUE = re.compile(r"[\d.]+[KMGT]?B")
+_RE_LATENCY_VALUE = re.compile(r"[\d.]+[msu]+")
+# Matches the detailed breakdown (connect count in group 1) or a bare total
+# (group 2) in one attempt
+_RE_SOCKET_ERRORS = re.compile(
+    r"Socket errors:(?: connect (\d+), read \d+, write \d+, timeout \d+| (\d+))"
+)
+# Oldest cached results beyond this many are evicted from output_dir/.cache
+_RESULT_CACHE_MAX_ENTRIES = 256
+_LATENCY_FIELDS = {
+    "50%": "latency_50",
+    "75%": "latency_75",
+    "90%": "latency_90",
+    "99%": "latency_99",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    # rich is imported on first use to keep module import cheap
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logger() -> logging.Logger:
+    # Configure the root handler once per process rather than per tester
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(console=_get_console(), rich_tracebacks=True)],
+    )
+    return logging.getLogger(__name__)
+
 
 class PerformanceTester:
     def __init__(self, config: Config):
         self.config = config
-        self.console = Console()
+        self.console = _get_console()
         self.logger = self._setup_logging()
         self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _setup_logging(self) -> logging.Logger:
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(message)s",
-            datefmt="[%X]",
-            handlers=[RichHandler(console=self.console, rich_tracebacks=True)],
-        )
-        return logging.getLogger(__name__)
+        return _get_logger()
 
     def check_dependencies(self) -> bool:
         required = ["wrk"]
@@ -55,55 +95,47 @@ class PerformanceTester:
     def _command_exists(self, command: str) -> bool:
         if not command or not isinstance(command, str):
             return False
-        try:
-            safe_command = ["/usr/bin/which", str(command)]
-            subprocess.run(  # nosec: B603 - shell=False is explicitly set for security
-                safe_command,
-                capture_output=True,
-                check=True,
-                text=True,
-                shell=False,
-            )
-            return True
-        except (subprocess.CalledProcessError, Exception):
-            return False
+        return shutil.which(command) is not None
 
     def parse_wrk_output(self, output: str) -> ServerMetrics:
-        metrics = ServerMetrics()
-        match = re.search(r"Requests/sec:\s+([\d.]+)", output)
-        if match:
-            metrics.requests_per_sec = float(match.group(1))
-        match = re.search(r"Transfer/sec:\s+([\d.]+[KMGT]?B)", output)
-        if match:
-            metrics.transfer_per_sec = match.group(1)
-        match = re.search(r"(\d+) requests in", output)
-        if match:
-            metrics.total_requests = int(match.group(1))
-        match = re.search(
-            r"Socket errors: connect (\d+), read (\d+), write (\d+), timeout (\d+)",
-            output,
-        )
-        if match:
-            connect_errors = int(match.group(1))
-            metrics.total_errors = connect_errors
-        else:
-            match = re.search(r"Socket errors: (\d+)", output)
-            if match:
-                metrics.total_errors = int(match.group(1))
-        latency_patterns = {
-            "latency_50": r"\s+50%\s+([\d.]+[msu]+)",
-            "latency_75": r"\s+75%\s+([\d.]+[msu]+)",
-            "latency_90": r"\s+90%\s+([\d.]+[msu]+)",
-            "latency_99": r"\s+99%\s+([\d.]+[msu]+)",
-        }
-        for key, pattern in latency_patterns.items():
-            match = re.search(pattern, output)
-            if match:
-                setattr(metrics, key, match.group(1))
-        metrics.raw_output = output
-        return metrics
-
-    def run_test(self, test_config: TestConfig) -> Optional[TestResult]:
+        fields: Dict[str, Any] = {}
+        # Every metric lives in the summary wrk prints from its "Thread Stats"
+        # header onwards, so skip anything a Lua script printed before it
+        start = output.rfind("Thread Stats")
+        summary = output[start:] if start != -1 else output
+        # wrk prints one metric per line, so dispatch on each line's leading
+        # token in a single pass rather than scanning the output per metric
+        for line in summary.splitlines():
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            head = parts[0]
+            if head == "Requests/sec:":
+                match = _RE_NUMBER.match(parts[1])
+                if match:
+                    fields.setdefault("requests_per_sec", float(match.group(0)))
+            elif head == "Transfer/sec:":
+                match = _RE_TRANSFER_VALUE.match(parts[1])
+                if match:
+                    fields.setdefault("transfer_per_sec", match.group(0))
+            elif head in _LATENCY_FIELDS:
+                match = _RE_LATENCY_VALUE.match(parts[1])
+                if match:
+                    fields.setdefault(_LATENCY_FIELDS[head], match.group(0))
+            elif parts[1] == "requests" and head.isdigit():
+                if len(parts) > 2 and parts[2] == "in":
+                    fields.setdefault("total_requests", int(head))
+            elif head == "Socket" and "total_errors" not in fields:
+                match = _RE_SOCKET_ERRORS.match(line.strip())
+                if match:
+                    fields["total_errors"] = int(match.group(1) or match.group(2))
+        fields["raw_output"] = output
+        # Every value above already has its declared type, so skip validation
+        return ServerMetrics.model_construct(**fields)
+
+    def run_test(
+        self, test_config: TestConfig, index: Optional[int] = None
+    ) -> Optional[TestResult]:
         config = self.config.get_test_config(test_config)
         name = test_config.name
         url = test_config.url
@@ -127,28 +159,34 @@ class PerformanceTester:
             "--latency",
             str(url),
         ]
+        lua_path: Optional[Path] = None
         lua_script = config.get("lua_script")
-        if lua_script:
+        if lua_script and Path(lua_script).exists():
             lua_path = Path(lua_script)
-            if lua_path.exists():
-                cmd.extend(["-s", str(lua_path)])
-                self.logger.info(f"Using Lua script: {lua_path}")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            cmd.extend(["-s", str(lua_path)])
+            self.logger.info(f"Using Lua script: {lua_path}")
+        cache_file = None
+        if self.config.reuse_cache:
+            cache_file = self._result_cache_file(name, cmd, lua_path)
+            cached = self._load_cached_result(cache_file)
+            if cached is not None:
+                self.logger.info(f"Reusing cached result for {name}")
+                return cached
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        # run_all_tests passes the test's position when tests share a name or
+        # run in parallel, so two of them never write to the same files
+        stem = f"wrk_{name}_{timestamp}" + ("" if index is None else f"_{index}")
         try:
             self.logger.info("Starting wrk test...")
-            result = subprocess.run(  # nosec: B603 - shell=False is explicitly set for security
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=config["duration"] + 60,
-                shell=False,
+            output_file = self.output_dir / f"{stem}.txt"
+            returncode, stdout, stderr = self._stream_wrk(
+                cmd, output_file, timeout=config["duration"] + 60
             )
-            if result.returncode != 0:
-                self.logger.error(f"wrk failed: {result.stderr}")
+            if returncode != 0:
+                output_file.unlink()
+                self.logger.error(f"wrk failed: {stderr}")
                 return None
-            output_file = self.output_dir / f"wrk_{name}_{timestamp}.txt"
-            output_file.write_text(result.stdout)
-            metrics = self.parse_wrk_output(result.stdout)
+            metrics = self.parse_wrk_output(stdout)
             test_result = TestResult(
                 server=name,
                 url=url,
@@ -160,9 +198,13 @@ class PerformanceTester:
                 config=config,
                 output_file=str(output_file),
             )
-            json_file = self.output_dir / f"wrk_{name}_{timestamp}.json"
-            json_file.write_text(test_result.model_dump_json(indent=2))
+            json_file = self.output_dir / f"{stem}.json"
+            json_file.write_text(
+                test_result.model_dump_json(indent=2), encoding="utf-8"
+            )
             test_result.json_file = str(json_file)
+            if cache_file is not None:
+                self._store_cached_result(cache_file, test_result)
             self.logger.info(f"Results saved to: {output_file}")
             return test_result
         except subprocess.TimeoutExpired:
@@ -172,49 +214,155 @@ class PerformanceTester:
             self.logger.error(f"Test failed: {e}")
             return None
 
+    def _result_cache_file(
+        self, name: str, cmd: List[str], lua_path: Optional[Path]
+    ) -> Path:
+        # Key on everything that shapes the run, including the Lua script body
+        lua_digest = (
+            hashlib.sha256(lua_path.read_bytes()).hexdigest() if lua_path else None
+        )
+        key = _json_dumps({"name": name, "cmd": cmd, "lua": lua_digest}, pretty=False)
+        digest = hashlib.sha256(key).hexdigest()
+        return self.output_dir / ".cache" / f"{digest}.json"
+
+    def _load_cached_result(self, cache_file: Path) -> Optional[TestResult]:
+        try:
+            result = TestResult.model_validate_json(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        # Touch the entry so eviction drops the least recently used results
+        os.utime(cache_file)
+        return result
+
+    def _store_cached_result(self, cache_file: Path, result: TestResult) -> None:
+        cache_dir = cache_file.parent
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            cache_file.write_text(result.model_dump_json(), encoding="utf-8")
+            entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+            for stale in entries[:-_RESULT_CACHE_MAX_ENTRIES]:
+                stale.unlink()
+        except OSError as e:
+            self.logger.warning(f"Could not update result cache: {e}")
+
+    def _stream_wrk(
+        self, cmd: List[str], output_file: Path, timeout: float
+    ) -> Tuple[int, str, str]:
+        # Copy wrk's stdout to the output file as it is produced instead of
+        # buffering it all until exit; stderr goes to a temporary file so a
+        # chatty stderr can never fill its pipe and stall the stdout loop.
+        # Bytes are passed through untouched and decoded once at the end.
+        lines: List[bytes] = []
+        timed_out = threading.Event()
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(  # nosec: B603 - shell=False is explicitly set for security
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                shell=False,
+            ) as proc:
+
+                def kill() -> None:
+                    timed_out.set()
+                    proc.kill()
+
+                timer = threading.Timer(timeout, kill)
+                timer.start()
+                try:
+                    with open(output_file, "wb") as out:
+                        for line in proc.stdout or ():
+                            out.write(line)
+                            lines.append(line)
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+            if timed_out.is_set():
+                output_file.unlink()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            stderr_file.seek(0)
+            stdout = b"".join(lines).decode("utf-8", "replace")
+            stderr = stderr_file.read().decode("utf-8", "replace")
+            return returncode, stdout, stderr
+
     def run_all_tests(self) -> List[TestResult]:
-        results = []
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        tests = self.config.tests
+        outcomes: List[Optional[TestResult]] = []
+        parallel = self.config.max_workers > 1 and len(tests) > 1
+        # Only number the output files when two tests could otherwise share them
+        indexed = parallel or len({t.name for t in tests}) < len(tests)
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
         ) as progress:
-            task = progress.add_task("Running tests...", total=len(self.config.tests))
-            for test_config in self.config.tests:
-                try:
-                    result = self.run_test(test_config)
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Test {test_config.name} failed: {e}")
-                progress.update(task, advance=1)
-        return results
+            task = progress.add_task("Running tests...", total=len(tests))
+            if parallel:
+                from concurrent.futures import ThreadPoolExecutor, as_completed
+
+                self.logger.warning(
+                    "Running tests in parallel; tests sharing this host will "
+                    "compete with wrk for CPU"
+                )
+                # Each worker mostly waits on its wrk process, so threads suffice
+                with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+                    futures = [
+                        pool.submit(self._run_test_safely, test_config, index)
+                        for index, test_config in enumerate(tests)
+                    ]
+                    for _ in as_completed(futures):
+                        progress.update(task, advance=1)
+                    outcomes = [future.result() for future in futures]
+            else:
+                for index, test_config in enumerate(tests):
+                    outcomes.append(
+                        self._run_test_safely(test_config, index if indexed else None)
+                    )
+                    progress.update(task, advance=1)
+        return [result for result in outcomes if result]
+
+    def _run_test_safely(
+        self, test_config: TestConfig, index: Optional[int] = None
+    ) -> Optional[TestResult]:
+        try:
+            return self.run_test(test_config, index)
+        except Exception as e:
+            self.logger.error(f"Test {test_config.name} failed: {e}")
+            return None
 
     def generate_report(self, results: List[TestResult]) -> str:
         report_file = (
-            self.output_dir
-            / f"performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            self.output_dir / f"performance_report_{time.strftime('%Y%m%d_%H%M%S')}.md"
         )
-        with open(report_file, "w") as f:
-            f.write("# Performance Test Report\n")
-            f.write(f"*Generated on {datetime.now().isoformat()}*\n\n")
-            f.write("## Test Configuration\n")
-            f.write(f"- Duration: {self.config.duration}s\n")
-            f.write(f"- Connections: {self.config.connections}\n")
-            f.write(f"- Threads: {self.config.threads}\n")
-            f.write(f"- Warmup: {self.config.warmup}s\n")
-            f.write(f"- Output Directory: {self.config.output_dir}\n\n")
-            f.write("## Results\n\n")
-            for result in results:
-                f.write(f"### {result.server}\n")
-                f.write(f"**URL**: {result.url}\n\n")
-                if result.metrics.requests_per_sec:
-                    f.write(f"**Requests/sec**: {result.metrics.requests_per_sec}\n")
-                if result.metrics.transfer_per_sec:
-                    f.write(f"**Transfer/sec**: {result.metrics.transfer_per_sec}\n")
-                f.write("```\n")
-                if result.output_file and Path(result.output_file).exists():
-                    f.write(Path(result.output_file).read_text())
-                f.write("\n```\n\n")
+        # Assemble the whole report first and write it with a single call
+        parts = [
+            "# Performance Test Report\n",
+            f"*Generated on {datetime.now().isoformat()}*\n\n",
+            "## Test Configuration\n",
+            f"- Duration: {self.config.duration}s\n",
+            f"- Connections: {self.config.connections}\n",
+            f"- Threads: {self.config.threads}\n",
+            f"- Warmup: {self.config.warmup}s\n",
+            f"- Output Directory: {self.config.output_dir}\n\n",
+            "## Results\n\n",
+        ]
+        for result in results:
+            parts.append(f"### {result.server}\n")
+            parts.append(f"**URL**: {result.url}\n\n")
+            if result.metrics.requests_per_sec:
+                parts.append(f"**Requests/sec**: {result.metrics.requests_per_sec}\n")
+            if result.metrics.transfer_per_sec:
+                parts.append(f"**Transfer/sec**: {result.metrics.transfer_per_sec}\n")
+            parts.append("```\n")
+            # The raw wrk output is normally still in memory from parsing;
+            # only fall back to reading the saved output file
+            if result.metrics.raw_output is not None:
+                parts.append(result.metrics.raw_output)
+            elif result.output_file and Path(result.output_file).exists():
+                parts.append(Path(result.output_file).read_text())
+            parts.append("\n```\n\n")
+        report_file.write_bytes("".join(parts).encode())
         self.logger.info(f"Report generated: {report_file}")
         return str(report_file)
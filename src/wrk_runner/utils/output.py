@@ -1,14 +1,36 @@
-import json
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from rich.console import Console
-from rich.table import Table
+from ..core._json import _json_dump, _json_load
+from ..core.models import TEST_RESULTS_ADAPTER, TestResult
 
-from ..core.models import TestResult
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+    from rich.table import Table
 
+_CSV_FIELDS = (
+    "server",
+    "url",
+    "timestamp",
+    "duration",
+    "connections",
+    "threads",
+    "metrics.requests_per_sec",
+    "metrics.transfer_per_sec",
+    "metrics.latency_50",
+    "metrics.latency_75",
+    "metrics.latency_90",
+    "metrics.latency_99",
+)
+_CSV_FIELDNAMES = tuple(field.rpartition(".")[2] for field in _CSV_FIELDS)
+# Projects a result straight to a row tuple, avoiding a dict per row
+_csv_row = attrgetter(*_CSV_FIELDS)
+
+
+def create_summary_table(results: List[TestResult]) -> "Table":
+    from rich.table import Table
 
-def create_summary_table(results: List[TestResult]) -> Table:
     table = Table(title="Performance Test Results")
     table.add_column("Server", style="cyan", no_wrap=True)
     table.add_column("URL", style="magenta")
@@ -17,17 +39,24 @@ def create_summary_table(results: List[TestResult]) -> Table:
     table.add_column("Latency 50%", style="yellow", justify="right")
     table.add_column("Latency 99%", style="red", justify="right")
     for result in results:
+        metrics = result.metrics
         table.add_row(
             result.server,
             result.url,
-            str(result.metrics.requests_per_sec or "N/A"),
-            str(result.metrics.transfer_per_sec or "N/A"),
-            str(result.metrics.latency_50 or "N/A"),
-            str(result.metrics.latency_99 or "N/A"),
+            _or_na(metrics.requests_per_sec),
+            _or_na(metrics.transfer_per_sec),
+            _or_na(metrics.latency_50),
+            _or_na(metrics.latency_99),
         )
     return table
 
 
+def _or_na(value: Optional[Union[float, str]]) -> str:
+    if value is None:
+        return "N/A"
+    return value if isinstance(value, str) else str(value)
+
+
 def export_results_json(results: List[TestResult], output_file: Path) -> None:
     data = {
         "timestamp": results[0].timestamp if results else None,
@@ -35,10 +64,15 @@ def export_results_json(results: List[TestResult], output_file: Path) -> None:
             "total_tests": len(results),
             "successful_tests": len([r for r in results if r.metrics.requests_per_sec]),
         },
-        "results": [result.model_dump() for result in results],
+        # Dump the whole batch in one call rather than one model_dump per result
+        "results": TEST_RESULTS_ADAPTER.dump_python(results),
     }
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
+    _json_dump(data, output_file)
+
+
+def load_results_json(input_file: Path) -> Dict[str, Any]:
+    data: Dict[str, Any] = _json_load(input_file)
+    return data
 
 
 def export_results_csv(results: List[TestResult], output_file: Path) -> None:
@@ -46,59 +80,31 @@ def export_results_csv(results: List[TestResult], output_file: Path) -> None:
 
     if not results:
         return
-    fieldnames = [
-        "server",
-        "url",
-        "timestamp",
-        "duration",
-        "connections",
-        "threads",
-        "requests_per_sec",
-        "transfer_per_sec",
-        "latency_50",
-        "latency_75",
-        "latency_90",
-        "latency_99",
-    ]
-    with open(output_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results:
-            row = {
-                "server": result.server,
-                "url": result.url,
-                "timestamp": result.timestamp,
-                "duration": result.duration,
-                "connections": result.connections,
-                "threads": result.threads,
-                "requests_per_sec": result.metrics.requests_per_sec,
-                "transfer_per_sec": result.metrics.transfer_per_sec,
-                "latency_50": result.metrics.latency_50,
-                "latency_75": result.metrics.latency_75,
-                "latency_90": result.metrics.latency_90,
-                "latency_99": result.metrics.latency_99,
-            }
-            writer.writerow(row)
-
-
-def print_results_summary(console: Console, results: List[TestResult]) -> None:
+    # A large buffer turns thousands of rows into a handful of write() calls
+    with open(output_file, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_FIELDNAMES)
+        writer.writerows(map(_csv_row, results))
+
+
+def print_results_summary(console: "Console", results: List[TestResult]) -> None:
     if not results:
         console.print("[red]No results to display[/red]")
         return
-    console.print(create_summary_table(results))
-    successful = [r for r in results if r.metrics.requests_per_sec]
+    from rich.console import Group
+
+    renderables: List[RenderableType] = [create_summary_table(results)]
+    total_rps, successful = 0.0, 0
+    for result in results:
+        rps = result.metrics.requests_per_sec
+        if rps:
+            total_rps += rps
+            successful += 1
     if successful:
-        avg_rps = (
-            sum(
-                r.metrics.requests_per_sec
-                for r in successful
-                if r.metrics.requests_per_sec is not None
-            )
-            / len(successful)
-            if successful
-            else 0.0
-        )
-        console.print(f"\n[green]Average requests/sec: {avg_rps:.2f}[/green]")
-        console.print(
-            f"[blue]Successful tests: {len(successful)}/{len(results)}[/blue]"
+        avg_rps = total_rps / successful
+        renderables.append(f"\n[green]Average requests/sec: {avg_rps:.2f}[/green]")
+        renderables.append(
+            f"[blue]Successful tests: {successful}/{len(results)}[/blue]"
         )
+    # Render the table and the totals together in one print
+    console.print(Group(*renderables))
@@ -1,28 +1,136 @@
-import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from statistics import median
+from string import Template
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from rich.console import Console
 from rich.table import Table
 
-from ..core.parser import WRKParser
+from ..core._json import _json_dump, _json_dumps
+from ..core.parser import WRKParser, _scan_result_entries
+
+# Static report page shipped as package data; only its $-placeholders change
+_HTML_PAGE = Path(__file__).with_name("report.html.tmpl").read_text()
+# Same replacements as html.escape(quote=True), applied in one translate pass
+_HTML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+# Split around the table rows so they can be streamed straight to the file
+_HTML_HEAD, _, _html_tail = _HTML_PAGE.partition("$rows")
+_HTML_TAIL = Template(_html_tail)
+
+
+# (header, style, justify, no_wrap) column specs for generate_rich_table
+_RICH_TABLE_COLUMNS: Tuple[Tuple[str, str, str, bool], ...] = (
+    ("Server", "cyan", "left", True),
+    ("Duration", "magenta", "left", False),
+    ("Requests/sec", "green", "right", False),
+    ("Avg Latency", "yellow", "right", False),
+    ("P99 Latency", "red", "right", False),
+    ("Transfer/sec", "blue", "right", False),
+    ("Status Codes", "white", "left", False),
+)
+
+
+@dataclass
+class _ChartColumns:
+    servers: List[str] = field(default_factory=list)
+    requests_per_sec: List[float] = field(default_factory=list)
+    p50_latencies: List[float] = field(default_factory=list)
+    p99_latencies: List[float] = field(default_factory=list)
+    total_requests: List[int] = field(default_factory=list)
+
+
+def _extract_columns(results: List[Dict[str, Any]]) -> _ChartColumns:
+    # One pass over the results feeds every chart series
+    columns = _ChartColumns()
+    for result in results:
+        perf = result["performance"]
+        latency = result["latency"]
+        columns.servers.append(result["metadata"]["server"])
+        columns.requests_per_sec.append(perf.get("requests_per_sec_summary", 0))
+        columns.p50_latencies.append(latency.get("p50_ms", 0))
+        columns.p99_latencies.append(latency.get("p99_ms", 0))
+        columns.total_requests.append(perf.get("total_requests", 0))
+    return columns
+
+
+def _js_literal(values: List[Any]) -> str:
+    # "</" inside an inline script would end the <script> element early
+    return _json_dumps(values, pretty=False).decode().replace("</", "<\\/")
+
+
+def _html_row(result: Dict[str, Any]) -> str:
+    meta = result["metadata"]
+    perf = result["performance"]
+    latency = result["latency"]
+    return f"""
+            <tr>
+                <td>{meta.get('server', 'Unknown').translate(_HTML_ESCAPES)}</td>
+                <td>{float(perf.get('requests_per_sec_summary', 0)):.2f}</td>
+                <td>{float(latency.get('p50_ms', 0)):.2f}</td>
+                <td>{float(latency.get('p99_ms', 0)):.2f}</td>
+            </tr>
+            """
+
+
+def _bucket_bars(
+    bars: List[Tuple[str, float]], buckets: int
+) -> List[Tuple[str, float, float, float]]:
+    """Group bars sorted by value into ``buckets`` runs of near-equal size.
+
+    Returns (label, median, min, max) per bucket.
+    """
+    values = sorted(value for _, value in bars)
+    size, extra = divmod(len(values), buckets)
+    summaries = []
+    start = 0
+    for index in range(buckets):
+        end = start + size + (index < extra)
+        chunk = values[start:end]
+        summaries.append((f"{len(chunk)} tests", median(chunk), chunk[0], chunk[-1]))
+        start = end
+    return summaries
 
 
 class ChartGenerator:
-    def __init__(self, results_dir: str = "results"):
-        self.results_dir = Path(results_dir)
+    def __init__(self, results_dir: Union[str, Path] = "results"):
         self.parser = WRKParser(results_dir)
+        # Share the parser's Path rather than building a second one
+        self.results_dir = self.parser.results_dir
         self.console = Console()
+        # (file listing snapshot, parsed results) from the last scan
+        self._scan_cache: Optional[Tuple[Tuple[Any, ...], List[Dict[str, Any]]]] = None
+        # Output format -> handler taking (results, output_file)
+        self._formats: Dict[
+            str, Callable[[List[Dict[str, Any]], Optional[str]], str]
+        ] = {
+            "html": self._emit_html,
+            "json": self._emit_json,
+            "rich": self._emit_rich,
+        }
+
+    def _scan_results(self) -> List[Dict[str, Any]]:
+        # Reuse the previous parse while no result file was added, removed or
+        # rewritten, so rendering several formats scans and parses only once
+        snapshot = tuple(
+            sorted(
+                (entry.name, stat.st_mtime_ns, stat.st_size)
+                for entry in _scan_result_entries(self.results_dir)
+                for stat in (entry.stat(),)
+            )
+        )
+        if self._scan_cache is None or self._scan_cache[0] != snapshot:
+            self._scan_cache = (snapshot, self.parser.scan_and_parse_all())
+        return self._scan_cache[1]
 
     def generate_rich_table(self, results: List[Dict[str, Any]]) -> Table:
         table = Table(title="Performance Test Results")
-        table.add_column("Server", style="cyan", no_wrap=True)
-        table.add_column("Duration", style="magenta")
-        table.add_column("Requests/sec", style="green", justify="right")
-        table.add_column("Avg Latency", style="yellow", justify="right")
-        table.add_column("P99 Latency", style="red", justify="right")
-        table.add_column("Transfer/sec", style="blue", justify="right")
-        table.add_column("Status Codes", style="white")
+        for header, style, justify, no_wrap in _RICH_TABLE_COLUMNS:
+            table.add_column(
+                header, style=style, justify=justify, no_wrap=no_wrap  # type: ignore[arg-type]
+            )
         for result in results:
             meta = result["metadata"]
             perf = result["performance"]
@@ -54,151 +162,49 @@ class ChartGenerator:
         results: List[Dict[str, Any]],
         output_file: str = "performance_report.html",
     ) -> str:
-        servers = [r["metadata"]["server"] for r in results]
-        requests_per_sec = [
-            r["performance"].get("requests_per_sec_summary", 0) for r in results
-        ]
-        latencies = [r["latency"].get("p50_ms", 0) for r in results]
-        p99_latencies = [r["latency"].get("p99_ms", 0) for r in results]
-
-        html_template = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Performance Test Report</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .chart-container {{ width: 100%; max-width: 800px; margin: 20px 0; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <h1>Performance Test Report</h1>
-    <div class="chart-container">
-        <canvas id="requestsChart"></canvas>
-    </div>
-    <div class="chart-container">
-        <canvas id="latencyChart"></canvas>
-    </div>
-    <table>
-        <thead>
-            <tr>
-                <th>Server</th>
-                <th>Requests/sec</th>
-                <th>Avg Latency (ms)</th>
-                <th>P99 Latency (ms)</th>
-            </tr>
-        </thead>
-        <tbody>
-            {self._generate_html_table_rows(results)}
-        </tbody>
-    </table>
-    <script>
-        const ctx1 = document.getElementById('requestsChart').getContext('2d');
-        new Chart(ctx1, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(servers)},
-                datasets: [{{
-                    label: 'Requests/sec',
-                    data: {json.dumps(requests_per_sec)},
-                    backgroundColor: 'rgba(54, 162, 235, 0.2)',
-                    borderColor: 'rgba(54, 162, 235, 1)',
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false
-            }}
-        }});
-
-        const ctx2 = document.getElementById('latencyChart').getContext('2d');
-        new Chart(ctx2, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(servers)},
-                datasets: [
-                    {{
-                        label: 'Avg Latency (ms)',
-                        data: {json.dumps(latencies)},
-                        backgroundColor: 'rgba(255, 99, 132, 0.2)',
-                        borderColor: 'rgba(255, 99, 132, 1)',
-                        borderWidth: 1
-                    }},
-                    {{
-                        label: 'P99 Latency (ms)',
-                        data: {json.dumps(p99_latencies)},
-                        backgroundColor: 'rgba(75, 192, 192, 0.2)',
-                        borderColor: 'rgba(75, 192, 192, 1)',
-                        borderWidth: 1
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false
-            }}
-        }});
-    </script>
-</body>
-</html>
-        """
+        columns = _extract_columns(results)
         output_path = self.results_dir / output_file
-        with open(output_path, "w") as f:
-            f.write(html_template)
+        with open(output_path, "w", buffering=1 << 16) as f:
+            f.write(_HTML_HEAD)
+            f.writelines(self._iter_html_table_rows(results))
+            f.write(
+                _HTML_TAIL.substitute(
+                    servers=_js_literal(columns.servers),
+                    requests_per_sec=_js_literal(columns.requests_per_sec),
+                    latencies=_js_literal(columns.p50_latencies),
+                    p99_latencies=_js_literal(columns.p99_latencies),
+                )
+            )
         return str(output_path)
 
+    def _iter_html_table_rows(self, results: List[Dict[str, Any]]) -> Iterator[str]:
+        return map(_html_row, results)
+
     def _generate_html_table_rows(self, results: List[Dict[str, Any]]) -> str:
-        rows = ""
-        for result in results:
-            meta = result["metadata"]
-            perf = result["performance"]
-            latency = result["latency"]
-            rows += f"""
-            <tr>
-                <td>{meta.get('server', 'Unknown')}</td>
-                <td>{float(perf.get('requests_per_sec_summary', 0)):.2f}</td>
-                <td>{float(latency.get('p50_ms', 0)):.2f}</td>
-                <td>{float(latency.get('p99_ms', 0)):.2f}</td>
-            </tr>
-            """
-        return rows
+        return "".join(self._iter_html_table_rows(results))
 
     def generate_json_data(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns = _extract_columns(results)
         return {
             "summary": {
                 "total_tests": len(results),
-                "test_names": [r["metadata"]["server"] for r in results],
-                "total_requests": sum(
-                    r["performance"].get("total_requests", 0) for r in results
-                ),
+                # Each key gets its own list so editing one leaves the others
+                "test_names": columns.servers,
+                "total_requests": sum(columns.total_requests),
                 "avg_requests_per_sec": (
-                    sum(
-                        r["performance"].get("requests_per_sec_summary", 0)
-                        for r in results
-                    )
-                    / len(results)
-                    if results
-                    else 0
+                    sum(columns.requests_per_sec) / len(results) if results else 0
                 ),
             },
             "data": results,
             "charts": {
                 "requests_per_sec": {
-                    "labels": [r["metadata"]["server"] for r in results],
-                    "values": [
-                        r["performance"].get("requests_per_sec_summary", 0)
-                        for r in results
-                    ],
+                    "labels": list(columns.servers),
+                    "values": columns.requests_per_sec,
                 },
                 "latency_percentiles": {
-                    "labels": [r["metadata"]["server"] for r in results],
-                    "p50": [r["latency"].get("p50_ms", 0) for r in results],
-                    "p99": [r["latency"].get("p99_ms", 0) for r in results],
+                    "labels": list(columns.servers),
+                    "p50": columns.p50_latencies,
+                    "p99": columns.p99_latencies,
                 },
             },
         }
@@ -207,35 +213,60 @@ class ChartGenerator:
         if not results:
             self.console.print("[yellow]No results to display[/yellow]")
             return
-        max_value = max(
-            r["performance"].get("requests_per_sec_summary", 0) for r in results
-        )
+        columns = _extract_columns(results)
+        bars = list(zip(columns.servers, columns.requests_per_sec))
+        max_value = max(value for _, value in bars)
         self.console.print("\n[bold cyan]Requests/sec Chart[/bold cyan]")
-        for result in results:
-            server = result["metadata"]["server"]
-            value = result["performance"].get("requests_per_sec_summary", 0)
-            if max_value > 0:
-                bar_length = int((value / max_value) * 50)
-                bar = "█" * bar_length
-                self.console.print(f"{server:20} |{bar} {value:,.0f}")
+        if max_value <= 0:
+            return
+        # Past one row per four columns of terminal the chart is unreadable;
+        # summarise runs of similar throughput instead of drawing every test
+        buckets = max(1, self.console.size.width // 4)
+        if len(bars) > buckets:
+            self.console.print(
+                "\n".join(
+                    f"{label:20} |{'█' * int((mid / max_value) * 50)} "
+                    f"{mid:,.0f} ({low:,.0f}-{high:,.0f})"
+                    for label, mid, low, high in _bucket_bars(bars, buckets)
+                )
+            )
+        else:
+            # One print for the whole chart instead of one rich render per bar
+            self.console.print(
+                "\n".join(
+                    f"{server:20} |{'█' * int((value / max_value) * 50)} {value:,.0f}"
+                    for server, value in bars
+                )
+            )
 
     def scan_and_visualize(
         self, output_format: str = "html", output_file: Optional[str] = None
     ) -> str:
-        results = self.parser.scan_and_parse_all()
+        results = self._scan_results()
         if not results:
             self.console.print("[red]No wrk results found[/red]")
             return ""
-        if output_format == "html":
-            filename = output_file or "performance_report.html"
-            return self.generate_html_chart(results, filename)
-        elif output_format == "json":
-            filename = output_file or "performance_data.json"
-            data = self.generate_json_data(results)
-            with open(self.results_dir / filename, "w") as f:
-                json.dump(data, f, indent=2)
-            return str(self.results_dir / filename)
-        elif output_format == "rich":
-            self.create_rich_charts(results)
+        handler = self._formats.get(output_format)
+        if handler is None:
             return ""
+        return handler(results, output_file)
+
+    def _emit_html(
+        self, results: List[Dict[str, Any]], output_file: Optional[str]
+    ) -> str:
+        return self.generate_html_chart(
+            results, output_file or "performance_report.html"
+        )
+
+    def _emit_json(
+        self, results: List[Dict[str, Any]], output_file: Optional[str]
+    ) -> str:
+        output_path = self.results_dir / (output_file or "performance_data.json")
+        _json_dump(self.generate_json_data(results), output_path)
+        return str(output_path)
+
+    def _emit_rich(
+        self, results: List[Dict[str, Any]], output_file: Optional[str]
+    ) -> str:
+        self.create_rich_charts(results)
         return ""
@@ -0,0 +1,156 @@
+import os
+import tempfile
+from pathlib import Path
+
+from rich.console import Console
+
+from wrk_runner.visualization.charts import ChartGenerator
+
+SAMPLE_OUTPUT = """Running 30s test @ http://localhost:8000/api
+  4 threads and 1000 connections
+  Latency Distribution
+     50%   10.50ms
+     99%   55.10ms
+  50000 requests in 30.00s, 50.00MB read
+Requests/sec:   1666.67
+Transfer/sec:      1.67MB
+"""
+
+
+def write_result(results_dir: Path, server: str) -> Path:
+    path = results_dir / f"wrk_{server}_20240101_120000.txt"
+    path.write_text(SAMPLE_OUTPUT)
+    return path
+
+
+class TestChartGenerator:
+    """Tests for ChartGenerator."""
+
+    def test_scan_results_reused_until_files_change(self):
+        """Test parsed results are reused while the result files are unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+
+            first = generator._scan_results()
+            assert generator._scan_results() is first
+
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert generator._scan_results() is not first
+
+    def test_generate_json_data(self):
+        """Test JSON chart data is built from every result."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            write_result(Path(temp_dir), "beta")
+            generator = ChartGenerator(temp_dir)
+
+            data = generator.generate_json_data(
+                sorted(generator._scan_results(), key=lambda r: r["metadata"]["server"])
+            )
+
+            assert data["summary"]["total_tests"] == 2
+            assert data["summary"]["total_requests"] == 100000
+            assert data["charts"]["requests_per_sec"]["labels"] == ["alpha", "beta"]
+            assert data["charts"]["latency_percentiles"]["p99"] == [55.1, 55.1]
+
+    def test_generate_json_data_tracks_list_changes(self):
+        """Test chart data reflects the current results and shares no lists."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+            results = generator._scan_results()
+            generator.generate_json_data(results)
+
+            results.append(
+                {
+                    "metadata": {"server": "beta"},
+                    "performance": {"requests_per_sec_summary": 10.0},
+                    "latency": {},
+                }
+            )
+            data = generator.generate_json_data(results)
+
+            assert data["summary"]["test_names"] == ["alpha", "beta"]
+            data["summary"]["test_names"].append("gamma")
+            assert data["charts"]["requests_per_sec"]["labels"] == ["alpha", "beta"]
+            assert data["charts"]["latency_percentiles"]["labels"] == [
+                "alpha",
+                "beta",
+            ]
+
+    def test_generate_html_chart(self):
+        """Test the HTML report contains a row and chart series per result."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+
+            report = Path(
+                generator.generate_html_chart(generator._scan_results(), "report.html")
+            )
+            html = report.read_text()
+
+            assert html.count("<tr>") == 2  # header + one result
+            assert "<td>alpha</td>" in html
+            assert 'labels: ["alpha"]' in html
+            assert "$" not in html
+
+    def test_generate_html_chart_escapes_server_names(self):
+        """Test server names are escaped in the table and the inline script."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+            results = generator._scan_results()
+            results[0]["metadata"]["server"] = "a&b</script><i>"
+
+            report = Path(generator.generate_html_chart(results, "report.html"))
+            html = report.read_text()
+
+            assert "<td>a&amp;b&lt;/script&gt;&lt;i&gt;</td>" in html
+            assert html.count("</script>") == 2  # chart.js include + inline script
+
+    def test_generate_html_table_rows(self):
+        """Test table rows format the parsed metrics."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+
+            rows = generator._generate_html_table_rows(generator._scan_results())
+
+            assert "<td>alpha</td>" in rows
+            assert "<td>1666.67</td>" in rows
+            assert "<td>10.50</td>" in rows
+
+    def test_scan_and_visualize_dispatch(self):
+        """Test each output format is routed to its handler."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_result(Path(temp_dir), "alpha")
+            generator = ChartGenerator(temp_dir)
+
+            json_path = generator.scan_and_visualize("json")
+            assert json_path == str(Path(temp_dir) / "performance_data.json")
+            assert Path(json_path).exists()
+            assert generator.scan_and_visualize("invalid_format") == ""
+
+    def test_create_rich_charts_buckets_large_batches(self):
+        """Test large batches are summarised into one row per bucket."""
+        generator = ChartGenerator()
+        generator.console = Console(record=True, width=120)
+        results = [
+            {
+                "metadata": {"server": f"s{i}"},
+                "performance": {"requests_per_sec_summary": float(i + 1)},
+                "latency": {},
+            }
+            for i in range(61)
+        ]
+
+        generator.create_rich_charts(results)
+        lines = generator.console.export_text().splitlines()
+
+        rows = [line for line in lines if "|" in line]
+        assert len(rows) == 30
+        assert rows[0].startswith("3 tests")
+        assert rows[0].endswith("2 (1-3)")
+        assert rows[-1].startswith("2 tests")
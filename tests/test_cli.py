@@ -0,0 +1,88 @@
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from wrk_runner.cli.main import cli
+from wrk_runner.core import _cache
+
+SAMPLE_OUTPUT = """Running 30s test @ http://localhost:8000/api
+  4 threads and 1000 connections
+  50000 requests in 30.00s, 50.00MB read
+Status codes: 200: 4990 (99.8%), 404: 10 (0.2%)
+Requests/sec:   1666.67
+Transfer/sec:      1.67MB
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_dirs(tmp_path, monkeypatch):
+    """Keep the parse cache and the default results dir out of the checkout."""
+    monkeypatch.setattr(_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.chdir(tmp_path)
+
+
+class TestParseCommand:
+    """Tests for the ``parse`` command."""
+
+    def write_result(self, temp_dir: str) -> Path:
+        path = Path(temp_dir) / "wrk_alpha_20240101_120000.txt"
+        path.write_text(SAMPLE_OUTPUT)
+        return path
+
+    def test_parse_json(self):
+        """Test JSON output includes the parsed data and raw output."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.write_result(temp_dir)
+            output_file = Path(temp_dir) / "parsed.json"
+
+            result = CliRunner().invoke(
+                cli, ["parse", str(path), "-f", "json", "-o", str(output_file)]
+            )
+
+            assert result.exit_code == 0, result.output
+            data = json.loads(output_file.read_text())
+            assert data["test_names"] == ["alpha"]
+            assert data["tests"][0]["raw_output"] == SAMPLE_OUTPUT
+
+    def test_parse_yaml(self):
+        """Test YAML output can be dumped and loaded back."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.write_result(temp_dir)
+            output_file = Path(temp_dir) / "parsed.yaml"
+
+            result = CliRunner().invoke(
+                cli, ["parse", str(path), "-f", "yaml", "-o", str(output_file)]
+            )
+
+            assert result.exit_code == 0, result.output
+            data = yaml.safe_load(output_file.read_text())
+            assert data["test_names"] == ["alpha"]
+            assert data["tests"][0]["raw_output"] == SAMPLE_OUTPUT
+            assert data["tests"][0]["status_codes"][200]["count"] == 4990
+
+    def test_parse_yaml_stdout(self):
+        """Test YAML output written to stdout."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.write_result(temp_dir)
+
+            result = CliRunner().invoke(cli, ["parse", str(path), "-f", "yaml"])
+
+            assert result.exit_code == 0, result.output
+            assert "test_names:" in result.output
+            assert "- alpha" in result.output
+
+
+class TestTestCommand:
+    """Tests for the ``test`` command."""
+
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_parallel_must_be_positive(self, value):
+        """Test -p/--parallel rejects values below 1."""
+        result = CliRunner().invoke(cli, ["test", "http://localhost:8000", "-p", value])
+
+        assert result.exit_code == 2
+        assert "--parallel" in result.output
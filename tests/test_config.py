@@ -1,4 +1,12 @@
-from wrk_runner.core.config import Config, TestConfig
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from wrk_runner.core import _cache
+from wrk_runner.core import config as config_module
+from wrk_runner.core.config import Config, TestConfig, _load_cached
 
 
 class TestTestConfig:
@@ -35,6 +43,7 @@ class TestMainConfig:
         )
         assert len(config.tests) == 2
         assert config.duration == 30  # default
+        assert config.max_workers == 1  # default
         assert config.connections == 1000  # default
 
     def test_config_custom_values(self):
@@ -53,6 +62,22 @@ class TestMainConfig:
         assert config.warmup == 10
         assert config.output_dir == "test_results"
 
+    def test_config_rejects_non_positive_max_workers(self):
+        """Test max_workers must be at least one."""
+        with pytest.raises(ValueError):
+            Config(max_workers=0, tests=[TestConfig(name="t", url="http://x")])
+
+    def test_config_does_not_create_output_dir(self):
+        """Test validation leaves directory creation to the tester."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "nested" / "results"
+            config = Config(
+                output_dir=str(output_dir),
+                tests=[TestConfig(name="test", url="http://localhost:8000")],
+            )
+            assert config.output_dir == str(output_dir)
+            assert not output_dir.exists()
+
     def test_get_test_config(self):
         """Test getting effective configuration for a test."""
         base_config = Config(
@@ -74,3 +99,67 @@ class TestMainConfig:
         assert effective_config["duration"] == 60
         assert effective_config["connections"] == 2000
         assert effective_config["threads"] == 8  # from base config
+        assert effective_config["output_dir"] == "results"
+        assert "tests" not in effective_config
+
+
+class TestConfigFileCache:
+    """Tests for cached configuration file loading."""
+
+    def test_load_cached_reuses_parsed_data(self, monkeypatch):
+        """Test a warm cache returns data without re-parsing the file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            config_path = Path(temp_dir) / "config.json"
+            config_path.write_text(json.dumps({"tests": [{"name": "a", "url": "x"}]}))
+
+            first = _load_cached(config_path)
+            assert len(list((Path(temp_dir) / "cache" / "config").iterdir())) == 1
+
+            monkeypatch.setattr(
+                config_module,
+                "load_config_file",
+                lambda path: pytest.fail("cache miss"),
+            )
+            assert _load_cached(config_path) == first
+
+    def test_load_cached_invalidates_on_change(self, monkeypatch):
+        """Test modifying the file produces fresh data."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("duration: 10\n")
+            assert _load_cached(config_path) == {"duration": 10}
+
+            config_path.write_text("duration: 20000\n")
+            assert _load_cached(config_path) == {"duration": 20000}
+
+    def test_load_cached_invalidates_on_upgrade(self, monkeypatch):
+        """Test entries written by another package version are not reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("duration: 10\n")
+            _load_cached(config_path)
+
+            monkeypatch.setattr(_cache, "__version__", "0.0.0-other")
+            calls = []
+            monkeypatch.setattr(
+                config_module, "load_config_file", lambda path: calls.append(path)
+            )
+            _load_cached(config_path)
+            assert calls == [config_path]
+
+    def test_load_cached_prunes_old_entries(self, monkeypatch):
+        """Test the cache keeps at most _CACHE_MAX_ENTRIES entries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            monkeypatch.setattr(_cache, "_CACHE_MAX_ENTRIES", 2)
+            for i in range(4):
+                config_path = Path(temp_dir) / f"config{i}.yaml"
+                config_path.write_text(f"duration: {i}\n")
+                _load_cached(config_path)
+
+            entries = list((Path(temp_dir) / "cache" / "config").iterdir())
+            assert len(entries) == 2
+            assert all(entry.suffix == ".pickle" for entry in entries)
@@ -0,0 +1,54 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from wrk_runner.core import _json
+from wrk_runner.core._json import _json_dump, _json_dumps, _json_load, _json_write
+
+
+class TestJSONHelpers:
+    """Tests for the JSON helper functions."""
+
+    def test_round_trip(self):
+        """Test dumping and loading through a file."""
+        data = {"name": "api", "values": [1, 2.5, None], "nested": {"ok": True}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "data.json"
+            _json_dump(data, path)
+            assert _json_load(path) == data
+
+    def test_non_string_keys(self):
+        """Test integer keys such as status codes are serialized."""
+        data = json.loads(_json_dumps({200: {"count": 5}}))
+        assert data == {"200": {"count": 5}}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test output matches stdlib json when orjson is unavailable."""
+        monkeypatch.setattr(_json, "orjson", None)
+        data = {"a": [1, 2], "b": "c"}
+        assert _json_dumps(data) == json.dumps(data, indent=2).encode()
+        assert _json_dumps(data, pretty=False) == b'{"a":[1,2],"b":"c"}'
+
+    def test_write_to_stream(self, monkeypatch):
+        """Test streaming output matches the dumped form for both backends."""
+        data = {"tests": [{"server": "api", "rps": 1.5}]}
+        expected = json.dumps(data, indent=2) + "\n"
+        stream = io.StringIO()
+        _json_write(data, stream)
+        assert stream.getvalue() == expected
+
+        monkeypatch.setattr(_json, "orjson", None)
+        stream = io.StringIO()
+        _json_write(data, stream)
+        assert stream.getvalue() == expected
+
+    def test_write_to_binary_backed_stream(self):
+        """Test text streams with a binary buffer get the JSON in order."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("before\n")
+        _json_write({"a": 1}, stream, pretty=False)
+        stream.write("after\n")
+        stream.flush()
+        assert raw.getvalue() == b'before\n{"a":1}\nafter\n'
@@ -10,6 +10,7 @@ from wrk_runner.utils.output import (
     create_summary_table,
     export_results_csv,
     export_results_json,
+    load_results_json,
     print_results_summary,
 )
 
@@ -110,6 +111,7 @@ class TestOutputUtilities:
             assert len(data["results"]) == 1
             assert data["results"][0]["server"] == "test_api"
             assert data["results"][0]["metrics"]["requests_per_sec"] == 100.5
+            assert load_results_json(output_file) == data
 
     def test_export_results_json_empty(self):
         """Test JSON export with empty results."""
@@ -231,8 +233,8 @@ class TestOutputUtilities:
         console = Mock(spec=Console)
         print_results_summary(console, results)
 
-        # Verify console methods were called
-        assert console.print.called
+        # Table and totals are rendered in a single print
+        console.print.assert_called_once()
 
     def test_print_results_summary_empty(self):
         """Test printing empty results summary."""
@@ -265,16 +267,10 @@ class TestOutputUtilities:
             ),
         ]
 
-        console = Mock(spec=Console)
+        console = Console(record=True, width=120)
         print_results_summary(console, results)
 
-        # Should show average and success ratio
-        console.print.assert_called()
-        # Find the call with average requests/sec
-        avg_call = next(
-            call
-            for call in console.print.call_args_list
-            if "Average requests/sec" in str(call)
-        )
-        assert "100.00" in str(avg_call)
-        assert "Successful tests: 1/2" in str(console.print.call_args_list[-1][0][0])
+        # Should show average and success ratio after the table
+        output = console.export_text()
+        assert "Average requests/sec: 100.00" in output
+        assert output.rstrip().endswith("Successful tests: 1/2")
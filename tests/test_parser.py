@@ -3,6 +3,8 @@ from pathlib import Path
 
 import pytest
 
+from wrk_runner.core import _cache
+from wrk_runner.core import parser as parser_module
 from wrk_runner.core.parser import WRKParser
 
 
@@ -189,6 +191,8 @@ Status codes: 200: 4990 (99.8%), 404: 10 (0.2%)
         assert parser._parse_value("2M") == 2000000.0
         assert parser._parse_value("1.5MB") == 1500000.0
         assert parser._parse_value("2.5GB") == 2500000000.0
+        assert parser._parse_value("1.50k") == 1500.0
+        assert parser._parse_value("512B") == 512.0
 
     def test_parse_file_not_found(self):
         """Test error handling for missing file."""
@@ -257,6 +261,45 @@ Transfer/sec:     1.67MB
             assert 200 in result["status_codes"]
             assert 404 in result["status_codes"]
 
+            assert result["raw_output"] == content
+
+        finally:
+            temp_path.unlink()
+
+    def test_parse_file_without_raw_output(self):
+        """Test raw output is left out on request and can be read back."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "wrk_s0_20240101_120000.txt"
+            path.write_text("Requests/sec:   100.0\n")
+            parser = WRKParser(temp_dir, keep_raw=False)
+
+            result = parser.scan_and_parse_all()[0]
+
+            assert type(result) is dict
+            assert "raw_output" not in result
+            assert parser.read_raw_output(result["metadata"]["file_path"]) == (
+                "Requests/sec:   100.0\n"
+            )
+            assert "raw_output" in parser.parse_file(path)
+
+    def test_parse_latency_ignores_inline_percentages(self):
+        """Test percentiles are only read from their own lines."""
+        parser = WRKParser()
+        content = "progress 50% 1.0\n" + " " * 10000 + "\n     50%    2.50ms\n"
+        latency = parser._parse_latency_metrics(content)
+        assert latency["p50_ms"] == 2.5
+
+    def test_parse_empty_file(self):
+        """Test parsing an empty wrk output file."""
+        parser = WRKParser()
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            temp_path = Path(f.name)
+
+        try:
+            result = parser.parse_file(temp_path)
+            assert result["raw_output"] == ""
+            assert result["performance"] == {}
         finally:
             temp_path.unlink()
 
@@ -267,6 +310,89 @@ Transfer/sec:     1.67MB
             results = parser.scan_and_parse_all()
             assert results == []
 
+    def test_scan_and_parse_all_missing_directory(self):
+        """Test scanning a directory that does not exist."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            parser = WRKParser(str(Path(temp_dir) / "missing"))
+            assert parser.scan_and_parse_all() == []
+
+    def test_scan_skips_non_result_entries(self):
+        """Test only wrk_*.txt files are picked up by a scan."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_dir = Path(temp_dir)
+            (results_dir / "wrk_s0_20240101_120000.txt").write_text(
+                "Requests/sec:   100.0\n"
+            )
+            (results_dir / "wrk_s1_20240101_120000.log").write_text("")
+            (results_dir / "notes.txt").write_text("")
+            (results_dir / "wrk_dir_20240101_120000.txt").mkdir()
+            parser = WRKParser(temp_dir)
+
+            results = parser.scan_and_parse_all()
+
+            assert [r["metadata"]["server"] for r in results] == ["s0"]
+
+    def test_scan_and_parse_all_parallel(self, monkeypatch):
+        """Test the process pool path returns every parsed file."""
+        monkeypatch.setattr(parser_module, "_PARALLEL_MIN_FILES", 2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(3):
+                (Path(temp_dir) / f"wrk_s{i}_20240101_120000.txt").write_text(
+                    f"Requests/sec:   {i + 1}00.0\n"
+                )
+            parser = WRKParser(temp_dir)
+            results = parser.scan_and_parse_all()
+
+            assert sorted(r["metadata"]["server"] for r in results) == [
+                "s0",
+                "s1",
+                "s2",
+            ]
+
+    def test_scan_shares_fallback_timestamp(self):
+        """Test files without a timestamp in their name share one fallback."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("wrk_a.txt", "wrk_b.txt"):
+                (Path(temp_dir) / name).write_text("Requests/sec:   100.0\n")
+            parser = WRKParser(temp_dir)
+            results = parser.scan_and_parse_all()
+
+            timestamps = {r["metadata"]["timestamp"] for r in results}
+            assert len(results) == 2
+            assert len(timestamps) == 1
+
+    def test_scan_uses_parse_cache(self, monkeypatch):
+        """Test unchanged files are served from the parse cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            results_dir = Path(temp_dir) / "results"
+            results_dir.mkdir()
+            (results_dir / "wrk_s0_20240101_120000.txt").write_text(
+                "Requests/sec:   100.0\n"
+            )
+            parser = WRKParser(str(results_dir), use_cache=True)
+            first = parser.scan_and_parse_all()
+
+            calls = []
+            monkeypatch.setattr(parser, "parse_file", calls.append)
+            second = parser.scan_and_parse_all()
+
+            assert calls == []
+            assert second == first
+            assert second[0]["performance"]["requests_per_sec_summary"] == 100.0
+
+    def test_parse_cache_skips_files_without_timestamp(self, monkeypatch):
+        """Test the scan's fallback timestamp is never written to the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setattr(_cache, "CACHE_DIR", Path(temp_dir) / "cache")
+            results_dir = Path(temp_dir) / "results"
+            results_dir.mkdir()
+            (results_dir / "wrk_custom.txt").write_text("Requests/sec:   100.0\n")
+            parser = WRKParser(str(results_dir), use_cache=True)
+            parser.scan_and_parse_all()
+
+            assert not (Path(temp_dir) / "cache").exists()
+
     def test_get_summary_stats_empty(self):
         """Test summary stats with empty results."""
         parser = WRKParser()
@@ -302,3 +428,15 @@ Transfer/sec:     1.67MB
         assert summary["avg_requests_per_sec"] == 150
         assert summary["avg_latency"] == 15
         assert len(summary["tests"]) == 2
+
+    def test_iter_parse_all_is_lazy(self):
+        """Test files are parsed one at a time as the generator advances."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("wrk_a_20240101_120000.txt", "wrk_b_20240101_120000.txt"):
+                (Path(temp_dir) / name).write_text("Requests/sec:   100.0\n")
+            parser = WRKParser(temp_dir)
+
+            results = parser.iter_parse_all()
+            first = next(results)
+            assert first["performance"]["requests_per_sec_summary"] == 100.0
+            assert len(list(results)) == 1
@@ -1,22 +1,137 @@
+import io
 import json
-import tempfile
+import re
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from wrk_runner.core.config import Config, TestConfig
 from wrk_runner.core.models import ServerMetrics, TestResult
 from wrk_runner.core.tester import PerformanceTester
 
+WRK_OUTPUT_BASIC = """
+Running 30s test @ http://localhost:8000/api
+  4 threads and 1000 connections
+  Thread Stats   Avg      Stdev     Max   +/- Stdev
+    Latency    10.5ms    2.1ms   50.2ms   85.00%
+    Req/Sec     1.50k   200.5    2.00k    75.00%
+  50000 requests in 30.00s, 50.00MB read
+Requests/sec:   1666.67
+Transfer/sec:     1.67MB
+  Latency Distribution
+     50%    10.5ms
+     75%    15.2ms
+     90%    25.8ms
+     99%    55.1ms
+"""
+
+WRK_OUTPUT_PARTIAL = """
+Running 30s test @ http://localhost:8000/api
+  4 threads and 1000 connections
+"""
+
+WRK_OUTPUT_ERRORS = """
+Running 30s test @ http://localhost:8000/api
+  4 threads and 1000 connections
+  50000 requests in 30.00s, 50.00MB read
+  Socket errors: connect 5, read 2, write 1, timeout 0
+Requests/sec:   1666.67
+"""
+
+WRK_OUTPUT_RUN = """
+Running 30s test @ http://localhost:8000/api
+  2 threads and 100 connections
+  1000 requests in 30.00s, 1.00MB read
+Requests/sec:   33.33
+Transfer/sec:     34.13KB
+"""
+
+WRK_OUTPUT_RUN_ALL = """
+Running 30s test @ http://localhost:8000/api
+  2 threads and 100 connections
+  1000 requests in 30.00s, 1.00MB read
+Requests/sec:   33.33
+"""
+
+WRK_OUTPUT_API1 = """Running 30s test @ http://localhost:8000/api1
+  8 threads and 1000 connections
+  100 requests in 30.00s, 1.00MB read
+Requests/sec:   100.0"""
+
+
+class FakeWrkProcess:
+    """Minimal stand-in for the ``subprocess.Popen`` context manager of a wrk run.
+
+    Lighter than a MagicMock and only implements what ``_stream_wrk`` uses.
+    """
+
+    def __init__(self, stdout="", returncode=0):
+        self.stdout = io.BytesIO(stdout.encode())
+        self.returncode = returncode
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stdout.close()
+
+    def wait(self):
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path_factory, monkeypatch):
+    """Run each test from its own directory.
+
+    PerformanceTester creates its relative output_dir on construction, so this
+    keeps tests from sharing ./results and lets them run under pytest-xdist.
+    """
+    monkeypatch.chdir(tmp_path_factory.mktemp("cwd"))
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Single-test config shared by tests that do not modify it."""
+    return Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
+
+
+@pytest.fixture(scope="module")
+def two_test_config():
+    """Config with two tests against different endpoints."""
+    return Config(
+        tests=[
+            TestConfig(name="test1", url="http://localhost:8000/api1"),
+            TestConfig(name="test2", url="http://localhost:8000/api2"),
+        ]
+    )
+
+
+@pytest.fixture
+def mock_popen(monkeypatch):
+    """Replace ``subprocess.Popen`` with a Mock each test configures."""
+    popen = Mock()
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    return popen
+
+
+@pytest.fixture
+def tester(base_config):
+    """Fresh tester per test, so output_dir changes never leak between tests."""
+    return PerformanceTester(base_config)
+
 
 class TestPerformanceTester:
     """Tests for PerformanceTester class."""
 
-    def test_initialization(self):
+    def test_initialization(self, base_config, tester):
         """Test tester initialization."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
-        assert tester.config == config
+        assert tester.config == base_config
         assert tester.output_dir.name == "results"
 
     def test_initialization_custom_output_dir(self):
@@ -29,186 +144,182 @@ class TestPerformanceTester:
 
         assert tester.output_dir.name == "custom_results"
 
-    def test_command_exists_success(self):
+    def test_command_exists_success(self, tester):
         """Test command existence check when command exists."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+        with patch("shutil.which") as mock_which:
+            mock_which.return_value = "/usr/bin/wrk"
             assert tester._command_exists("wrk") is True
 
-    def test_command_exists_failure(self):
+    def test_command_exists_failure(self, tester):
         """Test command existence check when command doesn't exist."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Command not found")
+        with patch("shutil.which") as mock_which:
+            mock_which.return_value = None
             assert tester._command_exists("nonexistent") is False
 
-    def test_check_dependencies_success(self):
+    def test_check_dependencies_success(self, tester):
         """Test dependency check when all required dependencies are available."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
         with patch.object(tester, "_command_exists") as mock_exists:
             mock_exists.return_value = True
             assert tester.check_dependencies() is True
 
-    def test_check_dependencies_missing_required(self):
+    def test_check_dependencies_missing_required(self, tester):
         """Test dependency check when required dependencies are missing."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
         with patch.object(tester, "_command_exists") as mock_exists:
             mock_exists.side_effect = lambda cmd: cmd != "wrk"
             assert tester.check_dependencies() is False
 
-    def test_parse_wrk_output_basic(self):
-        """Test basic wrk output parsing."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            (
+                WRK_OUTPUT_BASIC,
+                {
+                    "requests_per_sec": 1666.67,
+                    "transfer_per_sec": "1.67MB",
+                    "total_requests": 50000,
+                    "latency_50": "10.5ms",
+                    "latency_75": "15.2ms",
+                    "latency_90": "25.8ms",
+                    "latency_99": "55.1ms",
+                },
+            ),
+            (
+                WRK_OUTPUT_PARTIAL,
+                {
+                    "requests_per_sec": None,
+                    "transfer_per_sec": None,
+                    "total_requests": None,
+                    "total_errors": None,
+                },
+            ),
+            (
+                WRK_OUTPUT_ERRORS,
+                {"total_errors": 5},
+            ),
+        ],
+        ids=["basic", "partial", "errors"],
+    )
+    def test_parse_wrk_output(self, tester, output, expected):
+        """Test wrk output parsing with full, partial and error output."""
+        metrics = tester.parse_wrk_output(output)
+        for field, value in expected.items():
+            assert getattr(metrics, field) == value
+        assert output in metrics.raw_output
 
+    def test_parse_wrk_output_ignores_script_output(self, tester):
+        """Test lines printed by a Lua script before the summary are skipped."""
         output = """
 Running 30s test @ http://localhost:8000/api
+Requests/sec:   1.0
   4 threads and 1000 connections
   Thread Stats   Avg      Stdev     Max   +/- Stdev
-    Latency    10.5ms    2.1ms   50.2ms   85.00%
-    Req/Sec     1.50k   200.5    2.00k    75.00%
+    Latency    10.50ms    5.20ms  100.00ms   75.00%
   50000 requests in 30.00s, 50.00MB read
 Requests/sec:   1666.67
-Transfer/sec:     1.67MB
-  Latency Distribution
-     50%    10.5ms
-     75%    15.2ms
-     90%    25.8ms
-     99%    55.1ms
 """
 
         metrics = tester.parse_wrk_output(output)
-        assert isinstance(metrics, ServerMetrics)
         assert metrics.requests_per_sec == 1666.67
-        assert metrics.transfer_per_sec == "1.67MB"
         assert metrics.total_requests == 50000
-        assert metrics.latency_50 == "10.5ms"
-        assert metrics.latency_75 == "15.2ms"
-        assert metrics.latency_90 == "25.8ms"
-        assert metrics.latency_99 == "55.1ms"
-        assert output in metrics.raw_output
-
-    def test_parse_wrk_output_partial(self):
-        """Test parsing wrk output with missing metrics."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
-        output = """
-Running 30s test @ http://localhost:8000/api
-  4 threads and 1000 connections
-"""
-
-        metrics = tester.parse_wrk_output(output)
-        assert isinstance(metrics, ServerMetrics)
-        assert metrics.requests_per_sec is None
-        assert metrics.transfer_per_sec is None
-        assert metrics.total_requests is None
-        assert metrics.total_errors is None
-
-    def test_parse_wrk_output_with_errors(self):
-        """Test parsing wrk output with socket errors."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
+        assert metrics.raw_output == output
 
-        output = """
-Running 30s test @ http://localhost:8000/api
-  4 threads and 1000 connections
-  50000 requests in 30.00s, 50.00MB read
-  Socket errors: connect 5, read 2, write 1, timeout 0
-Requests/sec:   1666.67
-"""
+    def test_return_types(self, tester, mock_popen, tmp_path):
+        """Test the parse and run entry points return the result models."""
+        mock_popen.side_effect = lambda *args, **kwargs: FakeWrkProcess(WRK_OUTPUT_RUN)
+        tester.output_dir = tmp_path
 
-        metrics = tester.parse_wrk_output(output)
-        assert isinstance(metrics, ServerMetrics)
-        assert metrics.total_errors == 5
+        assert isinstance(tester.parse_wrk_output(WRK_OUTPUT_BASIC), ServerMetrics)
+        assert isinstance(tester.run_test(tester.config.tests[0]), TestResult)
+        results = tester.run_all_tests()
+        assert results
+        assert all(isinstance(r, TestResult) for r in results)
 
-    @patch("subprocess.run")
-    def test_run_test_success(self, mock_run):
+    def test_run_test_success(self, mock_popen, tmp_path):
         """Test successful test execution."""
         config = Config(
             tests=[TestConfig(name="test_api", url="http://localhost:8000/api")]
         )
         tester = PerformanceTester(config)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-Running 30s test @ http://localhost:8000/api
-  2 threads and 100 connections
-  1000 requests in 30.00s, 1.00MB read
-Requests/sec:   33.33
-Transfer/sec:     34.13KB
-"""
-        mock_run.return_value = mock_result
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            result = tester.run_test(config.tests[0])
-
-            assert result is not None
-            assert isinstance(result, TestResult)
-            assert result.server == "test_api"
-            assert result.url == "http://localhost:8000/api"
-            assert result.duration == 30
-            assert result.connections == 1000  # default from global config
-            assert result.threads == 8  # default
-            assert result.metrics.requests_per_sec == 33.33
-            assert result.output_file is not None
-            assert result.json_file is not None
-
-            # Check files were created
-            assert Path(result.output_file).exists()
-            assert Path(result.json_file).exists()
-
-            # Check JSON file content
-            with open(result.json_file) as f:
-                json_data = json.load(f)
-                assert json_data["server"] == "test_api"
-                assert json_data["url"] == "http://localhost:8000/api"
-
-    @patch("subprocess.run")
-    def test_run_test_failure(self, mock_run):
+        mock_popen.return_value = FakeWrkProcess(WRK_OUTPUT_RUN)
+
+        tester.output_dir = tmp_path
+        result = tester.run_test(config.tests[0])
+
+        assert result is not None
+        assert result.server == "test_api"
+        assert result.url == "http://localhost:8000/api"
+        assert result.duration == 30
+        assert result.connections == 1000  # default from global config
+        assert result.threads == 8  # default
+        assert result.metrics.requests_per_sec == 33.33
+        assert result.output_file is not None
+        assert result.json_file is not None
+
+        # Check files were created
+        assert Path(result.output_file).read_text() == WRK_OUTPUT_RUN
+        assert Path(result.json_file).exists()
+
+        # Check JSON file content
+        with open(result.json_file) as f:
+            json_data = json.load(f)
+            assert json_data["server"] == "test_api"
+            assert json_data["url"] == "http://localhost:8000/api"
+
+    def test_run_test_failure(self, mock_popen, tmp_path):
         """Test test execution failure."""
         config = Config(
             tests=[TestConfig(name="test_api", url="http://localhost:8000/api")]
         )
         tester = PerformanceTester(config)
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Connection failed"
-        mock_run.return_value = mock_result
+        mock_popen.return_value = FakeWrkProcess(returncode=1)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            result = tester.run_test(config.tests[0])
-            assert result is None
+        tester.output_dir = tmp_path
+        result = tester.run_test(config.tests[0])
+        assert result is None
+        assert list(tmp_path.iterdir()) == []
 
-    @patch("subprocess.run")
-    def test_run_test_timeout(self, mock_run):
+    def test_run_test_timeout(self, mock_popen, tmp_path):
         """Test test execution timeout."""
         config = Config(
             tests=[TestConfig(name="test_api", url="http://localhost:8000/api")]
         )
         tester = PerformanceTester(config)
 
-        mock_run.side_effect = Exception("Timeout")
+        mock_popen.side_effect = Exception("Timeout")
+
+        tester.output_dir = tmp_path
+        result = tester.run_test(config.tests[0])
+        assert result is None
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            result = tester.run_test(config.tests[0])
-            assert result is None
+    def test_stream_wrk_real_process(self, tester, tmp_path):
+        """Test streaming stdout to disk and collecting stderr from a process."""
+        script = (
+            "import sys; print('line 1'); print('line 2'); sys.stderr.write('oops')"
+        )
 
-    def test_run_test_with_lua_script(self):
+        output_file = tmp_path / "out.txt"
+        returncode, stdout, stderr = tester._stream_wrk(
+            [sys.executable, "-c", script], output_file, timeout=30
+        )
+        assert returncode == 0
+        assert stdout == "line 1\nline 2\n"
+        assert stderr == "oops"
+        assert output_file.read_text() == stdout
+
+    def test_stream_wrk_timeout(self, tester, tmp_path):
+        """Test a process exceeding the timeout is killed."""
+        output_file = tmp_path / "out.txt"
+        with pytest.raises(subprocess.TimeoutExpired):
+            tester._stream_wrk(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                output_file,
+                timeout=0.2,
+            )
+        assert not output_file.exists()
+
+    def test_run_test_with_lua_script(self, mock_popen, tmp_path):
         """Test test execution with Lua script."""
         config = Config(
             lua_script="test.lua",
@@ -216,108 +327,120 @@ Transfer/sec:     34.13KB
         )
         tester = PerformanceTester(config)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".lua", delete=False) as f:
-            f.write("-- Test lua script")
-            lua_path = f.name
-
-        try:
-            config.lua_script = lua_path
-            tester.config = config
-
-            with patch("subprocess.run") as mock_run:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = "Requests/sec:   100.0"
-                mock_run.return_value = mock_result
-
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    tester.output_dir = Path(temp_dir)
-                    result = tester.run_test(config.tests[0])
-
-                    assert result is not None
-                    # Check that Lua script path was used in command
-                    mock_run.assert_called_once()
-                    call_args = mock_run.call_args[0][0]
-                    assert "-s" in call_args
-                    assert lua_path in call_args
-
-        finally:
-            Path(lua_path).unlink()
-
-    @patch("subprocess.run")
-    def test_run_all_tests(self, mock_run):
-        """Test running all configured tests."""
+        lua_file = tmp_path / "test.lua"
+        lua_file.write_text("-- Test lua script")
+        lua_path = str(lua_file)
+        config.lua_script = lua_path
+        tester.config = config
+
+        mock_popen.return_value = FakeWrkProcess("Requests/sec:   100.0")
+
+        tester.output_dir = tmp_path
+        result = tester.run_test(config.tests[0])
+
+        assert result is not None
+        # Check that Lua script path was used in command
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args[0][0]
+        assert "-s" in call_args
+        assert lua_path in call_args
+
+    def test_run_test_reuses_cached_result(self, mock_popen, tmp_path):
+        """Test an unchanged run is served from the result cache."""
         config = Config(
-            tests=[
-                TestConfig(name="test1", url="http://localhost:8000/api1"),
-                TestConfig(name="test2", url="http://localhost:8000/api2"),
-            ]
+            reuse_cache=True,
+            tests=[TestConfig(name="test_api", url="http://localhost:8000/api")],
         )
         tester = PerformanceTester(config)
+        mock_popen.side_effect = lambda *args, **kwargs: FakeWrkProcess(
+            "Requests/sec:   42.0\n"
+        )
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-Running 30s test @ http://localhost:8000/api
-  2 threads and 100 connections
-  1000 requests in 30.00s, 1.00MB read
-Requests/sec:   33.33
-"""
-        mock_run.return_value = mock_result
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            results = tester.run_all_tests()
+        tester.output_dir = tmp_path
+        first = tester.run_test(config.tests[0])
+        second = tester.run_test(config.tests[0])
 
-            assert len(results) == 2
-            assert all(isinstance(r, TestResult) for r in results)
-            assert results[0].server == "test1"
-            assert results[1].server == "test2"
+        assert mock_popen.call_count == 1
+        assert second is not None
+        assert second.metrics.requests_per_sec == 42.0
+        assert second.model_dump() == first.model_dump()
+        assert len(list((tmp_path / ".cache").iterdir())) == 1
 
-    @patch("subprocess.run")
-    @patch.object(PerformanceTester, "_command_exists")
-    def test_run_all_tests_with_failure(self, mock_command_exists, mock_run):
-        """Test running all tests with some failures."""
+    def test_run_all_tests_parallel(self, mock_popen, tmp_path):
+        """Test running tests concurrently keeps the configured order."""
         config = Config(
+            max_workers=3,
             tests=[
-                TestConfig(name="test1", url="http://localhost:8000/api1"),
-                TestConfig(name="test2", url="http://localhost:8000/api2"),
-            ]
+                TestConfig(name=f"test{i}", url=f"http://localhost:8000/api{i}")
+                for i in range(3)
+            ],
         )
         tester = PerformanceTester(config)
 
-        mock_command_exists.return_value = True
+        mock_popen.side_effect = lambda *args, **kwargs: FakeWrkProcess(
+            "Requests/sec:   33.33\n"
+        )
 
-        def mock_run_side_effect(*args, **kwargs):
-            cmd_str = str(args[0]) if args else ""
-            if "api1" in cmd_str:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = """Running 30s test @ http://localhost:8000/api1
-  8 threads and 1000 connections
-  100 requests in 30.00s, 1.00MB read
-Requests/sec:   100.0"""
-                return mock_result
-            else:
-                mock_result = Mock()
-                mock_result.returncode = 1
-                mock_result.stderr = "Connection failed"
-                return mock_result
+        tester.output_dir = tmp_path
+        results = tester.run_all_tests()
+
+        assert [r.server for r in results] == ["test0", "test1", "test2"]
+        assert mock_popen.call_count == 3
+        assert [Path(r.output_file).stem[-2:] for r in results] == ["_0", "_1", "_2"]
+
+    @pytest.mark.parametrize(
+        "api2_returncode,expected_servers",
+        [(0, ["test1", "test2"]), (1, ["test1"])],
+        ids=["all_pass", "one_fails"],
+    )
+    def test_run_all_tests(
+        self, mock_popen, two_test_config, tmp_path, api2_returncode, expected_servers
+    ):
+        """Test running all configured tests, dropping the ones that fail."""
+        tester = PerformanceTester(two_test_config)
+
+        def mock_popen_side_effect(*args, **kwargs):
+            if "api1" in str(args[0]):
+                return FakeWrkProcess(WRK_OUTPUT_API1)
+            return FakeWrkProcess(WRK_OUTPUT_RUN_ALL, returncode=api2_returncode)
+
+        mock_popen.side_effect = mock_popen_side_effect
+
+        tester.output_dir = tmp_path
+        results = tester.run_all_tests()
+
+        assert [r.server for r in results] == expected_servers
+        # Sequential runs of uniquely named tests keep the plain file names
+        for r in results:
+            assert re.fullmatch(
+                r"wrk_test\d_\d{8}_\d{6}\.txt", Path(r.output_file).name
+            )
 
-        mock_run.side_effect = mock_run_side_effect
+    def test_run_all_tests_same_name_keeps_both_outputs(self, mock_popen, tmp_path):
+        """Test that tests sharing a name write to separate files."""
+        config = Config(
+            tests=[
+                TestConfig(name="api", url=f"http://localhost:8000/api{i}")
+                for i in range(2)
+            ],
+        )
+        tester = PerformanceTester(config)
+        mock_popen.side_effect = lambda *args, **kwargs: FakeWrkProcess(
+            "Requests/sec:   33.33\n"
+        )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            results = tester.run_all_tests()
+        tester.output_dir = tmp_path
+        results = tester.run_all_tests()
 
-            assert len(results) == 1
-            assert results[0].server == "test1"
+        assert len({r.output_file for r in results}) == 2
+        assert len({r.json_file for r in results}) == 2
+        assert sorted(p.stem[-2:] for p in tmp_path.glob("wrk_api_*.json")) == [
+            "_0",
+            "_1",
+        ]
 
-    def test_generate_report(self):
+    def test_generate_report(self, tester, tmp_path):
         """Test report generation."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
-
         results = [
             TestResult(
                 server="test_api",
@@ -330,33 +453,46 @@ Requests/sec:   100.0"""
             )
         ]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            report_path = tester.generate_report(results)
+        tester.output_dir = tmp_path
+        report_path = tester.generate_report(results)
 
-            assert Path(report_path).exists()
-            assert report_path.endswith(".md")
+        assert Path(report_path).exists()
+        assert report_path.endswith(".md")
 
-            # Check report content
-            content = Path(report_path).read_text()
-            assert "# Performance Test Report" in content
-            assert "test_api" in content
-            assert "http://localhost:8000/api" in content
-            assert "100.0" in content
-            assert "1.2MB" in content
+        # Check report content
+        content = Path(report_path).read_text()
+        assert "# Performance Test Report" in content
+        assert "test_api" in content
+        assert "http://localhost:8000/api" in content
+        assert "100.0" in content
+        assert "1.2MB" in content
 
-    def test_generate_report_empty_results(self):
-        """Test report generation with empty results."""
-        config = Config(tests=[TestConfig(name="test", url="http://localhost:8000")])
-        tester = PerformanceTester(config)
+    def test_generate_report_uses_in_memory_output(self, tester, tmp_path):
+        """Test report embeds the parsed raw output without re-reading files."""
+        results = [
+            TestResult(
+                server="test_api",
+                url="http://localhost:8000/api",
+                duration=30,
+                connections=100,
+                threads=8,
+                metrics=ServerMetrics(raw_output="Requests/sec:   42.0"),
+                output_file="missing/wrk_test_api.txt",
+            )
+        ]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tester.output_dir = Path(temp_dir)
-            report_path = tester.generate_report([])
+        tester.output_dir = tmp_path
+        content = Path(tester.generate_report(results)).read_text()
+        assert "```\nRequests/sec:   42.0\n```" in content
+
+    def test_generate_report_empty_results(self, tester, tmp_path):
+        """Test report generation with empty results."""
+        tester.output_dir = tmp_path
+        report_path = tester.generate_report([])
 
-            assert Path(report_path).exists()
-            content = Path(report_path).read_text()
-            assert "# Performance Test Report" in content
+        assert Path(report_path).exists()
+        content = Path(report_path).read_text()
+        assert "# Performance Test Report" in content
 
     def test_get_test_config_override(self):
         """Test getting effective test configuration with overrides."""